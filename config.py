@@ -3,6 +3,8 @@
 import json
 import os
 import sys
+import threading
+from collections import deque
 
 _CONFIG_DIR = os.path.expanduser("~/.config/cozyapp")
 _CONFIG_PATH = os.path.join(_CONFIG_DIR, "config.json")
@@ -20,6 +22,19 @@ _DEFAULTS = {
 # In-memory config dict, populated by load()
 _config = dict(_DEFAULTS)
 
+# Cached 'host:port' string, cleared whenever host or port can change
+_server_address = None
+
+# Latest state waiting for the background writer; only the newest
+# snapshot matters, so older ones are dropped
+_state_pending = deque(maxlen=1)
+_state_event = threading.Event()
+_state_writer = None
+_state_writer_lock = threading.Lock()
+# Held while a queued snapshot is popped and written, so a flush can't
+# be overtaken by an older snapshot the writer already picked up
+_state_write_lock = threading.Lock()
+
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -34,7 +49,8 @@ def resource_path(relative_path):
 
 def load():
     """Load config from disk, falling back to defaults for missing keys."""
-    global _config
+    global _config, _server_address
+    _server_address = None
     try:
         with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
@@ -70,15 +86,53 @@ def load_state() -> dict:
 
 
 def save_state(state: dict):
-    """Persist state dict to disk."""
+    """Persist state dict to disk, replacing the old file atomically."""
+    tmp_path = _STATE_PATH + ".tmp"
     try:
         os.makedirs(_CONFIG_DIR, exist_ok=True)
-        with open(_STATE_PATH, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, _STATE_PATH)
     except Exception as e:
         print(f"State save error: {e}", flush=True)
 
 
+def save_state_async(state: dict):
+    """Queue a state dict to be written by a background thread."""
+    global _state_writer
+    _state_pending.append(state)
+    with _state_writer_lock:
+        if _state_writer is None:
+            _state_writer = threading.Thread(
+                target=_state_writer_loop, daemon=True
+            )
+            _state_writer.start()
+    _state_event.set()
+
+
+def _state_writer_loop():
+    """Write the most recently queued state whenever one arrives."""
+    while True:
+        _state_event.wait()
+        _state_event.clear()
+        _write_pending_state()
+
+
+def flush_state():
+    """Write any queued state now; call before the app exits."""
+    _write_pending_state()
+
+
+def _write_pending_state():
+    """Pop the queued state, if any, and write it to disk."""
+    with _state_write_lock:
+        try:
+            state = _state_pending.pop()
+        except IndexError:
+            return
+        save_state(state)
+
+
 def get(key):
     """Return the value for the given config key."""
     return _config.get(key, _DEFAULTS.get(key))
@@ -86,9 +140,15 @@ def get(key):
 
 def set(key, value):
     """Update a config value in memory (call save() to persist)."""
+    global _server_address
     _config[key] = value
+    if key in ("host", "port"):
+        _server_address = None
 
 
 def server_address():
     """Return the ComfyUI server address as 'host:port'."""
-    return f"{get('host')}:{get('port')}"
+    global _server_address
+    if _server_address is None:
+        _server_address = f"{get('host')}:{get('port')}"
+    return _server_address
@@ -7,9 +7,11 @@ application icon with anti-aliased rounded corners for use in the
 about dialog.
 """
 
-from PIL import Image, ImageDraw, ImageFilter
 import os
 
+import numpy as np
+from PIL import Image
+
 
 def generate_app_icon(input_path="assets/vanilla-lying.png",
                       output_path="assets/com.example.comfy_gen.png",
@@ -42,42 +44,28 @@ def generate_app_icon(input_path="assets/vanilla-lying.png",
     sample_y = new_height // 2
     bg_color = img_resized.getpixel((sample_x, sample_y))[:3]
 
-    # Work at supersampled resolution for anti-aliasing
-    supersample = 8
-    ss_size = size * supersample
-    ss_radius = corner_radius * supersample
-
-    # Create the image at supersampled resolution
-    output = Image.new("RGBA", (ss_size, ss_size), (*bg_color, 255))
-    x = (ss_size - new_width * supersample) // 2
-    y = (ss_size - new_height * supersample) // 2
-
-    # Paste the image with its alpha
-    img_ss = img_resized.resize(
-        (new_width * supersample, new_height * supersample),
-        Image.Resampling.LANCZOS
+    # Compose the icon content directly at its final size
+    output = Image.new("RGBA", (size, size), (*bg_color, 255))
+    x = (size - new_width) // 2
+    y = (size - new_height) // 2
+    output.paste(img_resized, (x, y), img_resized)
+
+    # Rounded-corner mask from a distance field at the final size:
+    # each pixel's coverage falls off with its distance past the
+    # corner radius, which anti-aliases the edge without supersampling
+    centers = np.arange(size) + 0.5
+    overshoot = np.maximum(0.0, corner_radius - np.minimum(
+        centers, size - centers
+    ))
+    dist = np.hypot(overshoot[:, None], overshoot[None, :])
+    coverage = np.clip(corner_radius + 0.5 - dist, 0.0, 1.0)
+    mask_small = Image.fromarray(
+        np.rint(coverage * 255).astype(np.uint8), "L"
     )
-    output.paste(img_ss, (x, y), img_ss)
-
-    # Create mask with rounded corners
-    mask = Image.new("L", (ss_size, ss_size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.rounded_rectangle(
-        [0, 0, ss_size - 1, ss_size - 1],
-        radius=ss_radius,
-        fill=255
-    )
-
-    # Apply Gaussian blur for anti-aliasing
-    mask = mask.filter(ImageFilter.GaussianBlur(radius=supersample))
-
-    # Downscale to final size
-    output_small = output.resize((size, size), Image.Resampling.LANCZOS)
-    mask_small = mask.resize((size, size), Image.Resampling.LANCZOS)
 
     # Apply mask to create final icon with rounded corners
-    result = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    result.paste(output_small, (0, 0), mask_small)
+    transparent = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    result = Image.composite(output, transparent, mask_small)
 
     # Save the result
     result.save(output_path, "PNG")
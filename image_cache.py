@@ -1,12 +1,28 @@
 #!/usr/bin/python3
 """Disk-based image cache for generated images."""
+import hashlib
 import json
 import os
+import shutil
 import time
 from pathlib import Path
 
+try:
+    # Optional faster codec; it reads and writes bytes directly
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 # Cache root and image subdirectory
 _CACHE_DIR = Path(os.path.expanduser("~/.cache/cozyapp/images"))
+# Scaled LoRA / model card previews, one PNG per preview URL
+_PREVIEW_DIR = _CACHE_DIR.parent / "previews"
+# Days a preview thumbnail is kept after it was last stored or
+# revalidated
+PREVIEW_MAX_AGE_DAYS = 30
 
 
 def _ensure_dir():
@@ -21,35 +37,84 @@ def list_images() -> list[Path]:
     Sorting oldest-first means callers that prepend to a list
     (e.g. the gallery) will display the newest image at the top.
     """
-    if not _CACHE_DIR.exists():
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith('.png') and e.is_file()
+            ]
+    except FileNotFoundError:
         return []
-    return sorted(
-        (p for p in _CACHE_DIR.iterdir()
-         if p.is_file() and p.suffix == '.png'),
-        key=lambda p: p.stat().st_mtime
-    )
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    return [Path(e.path) for e in entries]
 
 
-def save_image(data: bytes, image_info: dict = None) -> Path:
+def save_image(data: bytes, image_info=None) -> Path:
     """
     Write raw image bytes to the cache directory.
 
     Uses a nanosecond timestamp filename to avoid collisions.
     If image_info is provided, saves it as a sidecar JSON file
-    with the same stem. Returns the path of the saved image.
+    with the same stem; it may be a dict or already-encoded JSON
+    bytes, which are written as-is. Returns the path of the saved
+    image.
     """
     _ensure_dir()
     filename = f"{time.time_ns()}.png"
     path = _CACHE_DIR / filename
-    path.write_bytes(data)
-    if image_info:
-        json_path = path.with_suffix('.json')
-        json_path.write_text(
-            json.dumps(image_info), encoding='utf-8'
-        )
+    _write_atomic(path, data)
+    _save_sidecar(path, image_info)
     return path
 
 
+def save_stream(stream, image_info=None) -> Path:
+    """
+    Copy an image from a readable binary stream into the cache.
+
+    The data is written to a temporary file that is renamed into
+    place once complete, so a failed download never leaves a partial
+    image behind. image_info is handled as in save_image. Returns the
+    path of the saved image.
+    """
+    _ensure_dir()
+    path = _CACHE_DIR / f"{time.time_ns()}.png"
+    tmp_path = path.with_suffix('.png.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(stream, f, 64 * 1024)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _save_sidecar(path, image_info)
+    return path
+
+
+def _save_sidecar(path: Path, image_info=None):
+    """Write image_info (dict or JSON bytes) as an image's sidecar."""
+    if image_info:
+        if not isinstance(image_info, bytes):
+            image_info = _json_dumps(image_info)
+        _write_atomic(path.with_suffix('.json'), image_info)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """
+    Write data to path via a temp file and rename.
+
+    Readers never see a partially written file. There is no fsync;
+    the cache is disposable.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=0) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def load_image(path: Path) -> bytes:
     """Read and return raw bytes from a cached image path."""
     return Path(path).read_bytes()
@@ -63,7 +128,7 @@ def load_image_info(path: Path) -> dict | None:
     """
     json_path = Path(path).with_suffix('.json')
     try:
-        return json.loads(json_path.read_text(encoding='utf-8'))
+        return _json_loads(json_path.read_bytes())
     except FileNotFoundError:
         return None
     except Exception as e:
@@ -72,6 +137,26 @@ def load_image_info(path: Path) -> dict | None:
         return None
 
 
+def preview_path(url: str) -> Path:
+    """Return the cache path for the preview thumbnail at url."""
+    name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return _PREVIEW_DIR / f"{name}.png"
+
+
+def save_preview(url: str, data: bytes):
+    """Store encoded preview thumbnail bytes for url."""
+    _PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(preview_path(url), data)
+
+
+def touch_preview(url: str):
+    """Mark the stored preview for url as just revalidated."""
+    try:
+        os.utime(preview_path(url))
+    except OSError:
+        pass
+
+
 def cleanup_old(max_age_days: int = 1):
     """
     Delete cached images older than max_age_days days.
@@ -79,17 +164,49 @@ def cleanup_old(max_age_days: int = 1):
     Also removes any sidecar JSON files for deleted images.
     Silently skips files that cannot be removed.
     """
-    if not _CACHE_DIR.exists():
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        it = os.scandir(_CACHE_DIR)
+    except FileNotFoundError:
         return
+    with it:
+        for entry in it:
+            if not entry.name.endswith('.png'):
+                continue
+            try:
+                if not entry.is_file() or entry.stat().st_mtime >= cutoff:
+                    continue
+                os.unlink(entry.path)
+                try:
+                    os.unlink(entry.path[:-4] + '.json')
+                except FileNotFoundError:
+                    pass
+            except Exception as e:
+                print(
+                    f"Cache cleanup error ({entry.name}): {e}", flush=True
+                )
+
+
+def cleanup_previews(max_age_days: int = PREVIEW_MAX_AGE_DAYS):
+    """
+    Delete preview thumbnails not stored or revalidated in the last
+    max_age_days days.
+
+    Thumbnails in use are revalidated regularly, which refreshes their
+    mtime, so only previews that are no longer shown age out.
+    """
     cutoff = time.time() - max_age_days * 86400
-    for entry in _CACHE_DIR.iterdir():
-        if not entry.is_file() or entry.suffix != '.png':
-            continue
-        try:
-            if entry.stat().st_mtime < cutoff:
-                entry.unlink()
-                sidecar = entry.with_suffix('.json')
-                if sidecar.exists():
-                    sidecar.unlink()
-        except Exception as e:
-            print(f"Cache cleanup error ({entry.name}): {e}", flush=True)
+    try:
+        it = os.scandir(_PREVIEW_DIR)
+    except FileNotFoundError:
+        return
+    with it:
+        for entry in it:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except Exception as e:
+                print(
+                    f"Preview cleanup error ({entry.name}): {e}",
+                    flush=True
+                )
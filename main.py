@@ -238,6 +238,7 @@ class ComfyWindow(Adw.ApplicationWindow):
 
         # Purge cached images older than the configured threshold
         image_cache.cleanup_old(config.get("cache_max_age_days"))
+        image_cache.cleanup_previews()
 
         # Defer gallery loading until the window is visible so the UI
         # isn't blocked by idle callbacks before first render.
@@ -631,13 +632,16 @@ class ComfyWindow(Adw.ApplicationWindow):
         dialog.present(self)
 
     def on_close_request(self, window):
-        """Clean up debounce timers before closing."""
+        """Clean up debounce timers and save pending state before closing."""
         for timer_id in self.generate_page.debounce_timers:
             try:
                 GLib.source_remove(timer_id)
             except Exception:
                 pass
         self.generate_page.debounce_timers.clear()
+        # The background writer is a daemon thread and dies with the
+        # interpreter, so write the last snapshot here
+        config.flush_state()
         return False
 
     # ------------------------------------------------------------------
@@ -730,20 +734,26 @@ class ComfyWindow(Adw.ApplicationWindow):
             return None
 
     def _pixbuf_to_texture(self, pixbuf):
-        """Convert a GdkPixbuf to a Gdk.MemoryTexture."""
+        """Convert a GdkPixbuf to a Gdk.MemoryTexture (cached on it)."""
+        texture = getattr(pixbuf, '_texture', None)
+        if texture is not None:
+            return texture
         width = pixbuf.get_width()
         height = pixbuf.get_height()
         rowstride = pixbuf.get_rowstride()
         has_alpha = pixbuf.get_has_alpha()
-        pixels = pixbuf.get_pixels()
-        gbytes = GLib.Bytes.new(pixels)
+        # read_pixel_bytes() still copies loader-decoded pixels once, in
+        # C, instead of a Python bytes copy from get_pixels() plus the
+        # GBytes copy; caching the texture keeps that to one per image
+        gbytes = pixbuf.read_pixel_bytes()
         fmt = (
             Gdk.MemoryFormat.R8G8B8A8 if has_alpha
             else Gdk.MemoryFormat.R8G8B8
         )
-        return Gdk.MemoryTexture.new(
+        pixbuf._texture = Gdk.MemoryTexture.new(
             width, height, fmt, gbytes, rowstride
         )
+        return pixbuf._texture
 
     def _show_pixbuf_in_preview(self, pixbuf):
         """Display a pixbuf in the preview picture widget."""
@@ -833,19 +843,32 @@ class ComfyWindow(Adw.ApplicationWindow):
             loader.close()
             pix = loader.get_pixbuf()
             if pix:
-                self.gen_pixbuf = pix
-                if self.view_stack.get_visible_child_name() == 'generate':
-                    self._show_pixbuf_in_preview(pix)
+                self._set_gen_pixbuf(pix)
         except Exception:
             try:
                 loader.close()
             except Exception:
                 pass
 
-    def update_image_final(self, data, image_info=None):
-        """Display the final image and add it to the gallery."""
-        self.update_image(data)
-        cache_path = image_cache.save_image(data, image_info)
+    def _set_gen_pixbuf(self, pix):
+        """Store the latest generated image and show it if visible."""
+        self.gen_pixbuf = pix
+        if self.view_stack.get_visible_child_name() == 'generate':
+            self._show_pixbuf_in_preview(pix)
+
+    def update_image_final(self, cache_path, image_info=None):
+        """
+        Display the final image and add it to the gallery.
+
+        The generate worker has already written the image into the
+        cache; cache_path is where it lives.
+        """
+        try:
+            self._set_gen_pixbuf(
+                GdkPixbuf.Pixbuf.new_from_file(str(cache_path))
+            )
+        except GLib.Error as e:
+            self.log(f"Final image load error: {e}")
         self.gallery_selected_path = cache_path
         self.gallery.add_image(cache_path, image_info)
 
@@ -3,6 +3,7 @@
 import os
 import threading
 import subprocess
+from collections import deque
 from pathlib import Path
 import gi
 
@@ -15,6 +16,15 @@ from gi.repository import Gtk, Adw, Gdk, GdkPixbuf, GLib, Gio  # noqa
 THUMBNAIL_SIZE = 220
 # Images added per main-loop idle callback during batch load
 _LOAD_BATCH_SIZE = 20
+# Newly generated images inserted per main-loop idle callback
+_ADD_DRAIN_SIZE = 8
+# Fast deflate level for PNGs placed on the clipboard (0-9)
+_CLIPBOARD_PNG_COMPRESSION = "1"
+# Quality of the JPEG alternative offered for opaque images
+_CLIPBOARD_JPEG_QUALITY = "92"
+# File signatures used to pass cached images through without re-encoding
+_PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+_JPEG_MAGIC = b'\xff\xd8\xff'
 
 
 class GalleryPage(Gtk.ScrolledWindow):
@@ -40,6 +50,11 @@ class GalleryPage(Gtk.ScrolledWindow):
         self._last_activated_child = None
         # Active context popover (kept to dismiss on re-open)
         self._active_popover = None
+        # Decoded (cache_path, image_info, texture) entries waiting for
+        # _drain_pending; filled from any thread by add_image
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
 
         outer = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         for side in ['top', 'bottom', 'start', 'end']:
@@ -51,7 +66,7 @@ class GalleryPage(Gtk.ScrolledWindow):
             min_children_per_line=1,
             row_spacing=8,
             column_spacing=8,
-            homogeneous=True,
+            homogeneous=False,
             selection_mode=Gtk.SelectionMode.MULTIPLE,
             valign=Gtk.Align.START
         )
@@ -69,6 +84,14 @@ class GalleryPage(Gtk.ScrolledWindow):
         key_ctrl.connect('key-pressed', self._on_flow_key_pressed)
         self._flow.add_controller(key_ctrl)
 
+        # One CAPTURE-phase gesture for all children: intercepts before
+        # FlowBox default handling and hit-tests to find the child
+        click = Gtk.GestureClick()
+        click.set_button(0)  # Listen to all buttons
+        click.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        click.connect('pressed', self._on_flow_pressed)
+        self._flow.add_controller(click)
+
         outer.append(self._flow)
         self.set_child(outer)
 
@@ -108,9 +131,8 @@ class GalleryPage(Gtk.ScrolledWindow):
         """
         Add a cached image to the gallery by path (thread-safe).
 
-        Can be called from any thread. Heavy work (decode, scale) is
-        done on the calling thread; only widget creation hits the main
-        loop.
+        Can be called from any thread. Heavy work (decode) is done on
+        the calling thread; only widget creation hits the main loop.
         """
         # Do expensive work on the calling (background) thread
         try:
@@ -119,26 +141,36 @@ class GalleryPage(Gtk.ScrolledWindow):
             print(f"Gallery: failed to read cache file: {e}", flush=True)
             return
 
-        pixbuf = self._pixbuf_from_bytes(data)
-        if pixbuf is None:
+        texture = self._thumbnail_from_bytes(data)
+        if texture is None:
             return
 
-        thumb = self._scale_pixbuf(pixbuf, THUMBNAIL_SIZE)
-        # Extract raw pixels so we can hand off to the main thread
-        # without keeping a live pixbuf reference across threads.
-        w = thumb.get_width()
-        h = thumb.get_height()
-        rowstride = thumb.get_rowstride()
-        has_alpha = thumb.get_has_alpha()
-        pixels = bytes(thumb.get_pixels())
-
-        # Schedule only widget creation on the main thread
+        # Queue widget creation; images that finish close together are
+        # inserted from a single idle callback
+        with self._pending_lock:
+            self._pending.append((cache_path, image_info, texture))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
         GLib.idle_add(
-            self._add_image_idle,
-            cache_path, image_info,
-            w, h, rowstride, has_alpha, pixels
+            self._drain_pending, priority=GLib.PRIORITY_DEFAULT_IDLE
         )
 
+    def _drain_pending(self):
+        """Main thread: insert up to _ADD_DRAIN_SIZE queued images."""
+        with self._pending_lock:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(_ADD_DRAIN_SIZE, len(self._pending)))
+            ]
+        for cache_path, image_info, texture in batch:
+            self._add_image_idle(cache_path, image_info, texture)
+        with self._pending_lock:
+            if self._pending:
+                return True
+            self._drain_scheduled = False
+        return False
+
     def add_images_batch(self, images: list):
         """
         Add multiple cached images efficiently (thread-safe).
@@ -147,8 +179,8 @@ class GalleryPage(Gtk.ScrolledWindow):
         Decodes thumbnails sequentially in a background thread and
         schedules widget creation in _LOAD_BATCH_SIZE chunks so the
         main loop stays responsive and first images appear quickly.
-        GdkPixbuf is not thread-safe for concurrent use, so all
-        decoding stays on a single background thread.
+        All decoding stays on a single background thread so a large
+        cache doesn't saturate every core at startup.
         """
         if not images:
             return
@@ -170,16 +202,10 @@ class GalleryPage(Gtk.ScrolledWindow):
                     flush=True
                 )
                 continue
-            pixbuf = self._pixbuf_from_bytes(data)
-            if pixbuf is None:
+            texture = self._thumbnail_from_bytes(data)
+            if texture is None:
                 continue
-            thumb = self._scale_pixbuf(pixbuf, THUMBNAIL_SIZE)
-            chunk.append((
-                cache_path, image_info,
-                thumb.get_width(), thumb.get_height(),
-                thumb.get_rowstride(), thumb.get_has_alpha(),
-                bytes(thumb.get_pixels())
-            ))
+            chunk.append((cache_path, image_info, texture))
             # Schedule each full chunk immediately so thumbnails
             # appear progressively rather than all at once at the end.
             if len(chunk) >= _LOAD_BATCH_SIZE:
@@ -191,11 +217,9 @@ class GalleryPage(Gtk.ScrolledWindow):
     def _add_chunk_idle(self, chunk: list):
         """Main thread: create thumbnail widgets for one chunk."""
         self._placeholder.set_visible(False)
-        for entry in chunk:
-            cache_path, image_info, w, h, rs, alpha, px = entry
+        for cache_path, image_info, texture in chunk:
             self._add_image_idle(
-                cache_path, image_info, w, h, rs, alpha, px,
-                prepend=False
+                cache_path, image_info, texture, prepend=False
             )
         return False
 
@@ -223,21 +247,12 @@ class GalleryPage(Gtk.ScrolledWindow):
     # ------------------------------------------------------------------
 
     def _add_image_idle(
-        self, cache_path, image_info,
-        w, h, rowstride, has_alpha, pixels,
-        prepend=True
+        self, cache_path, image_info, texture, prepend=True
     ):
         """Create thumbnail widget and insert into grid (main thread)."""
         self._placeholder.set_visible(False)
 
-        # Rebuild texture from raw pixels — no decode on main thread
-        gbytes = GLib.Bytes.new(pixels)
-        fmt = (
-            Gdk.MemoryFormat.R8G8B8A8
-            if has_alpha else Gdk.MemoryFormat.R8G8B8
-        )
-        texture = Gdk.MemoryTexture.new(w, h, fmt, gbytes, rowstride)
-
+        # Thumbnail texture was decoded off-thread at THUMBNAIL_SIZE
         picture = Gtk.Picture(
             paintable=texture,
             content_fit=Gtk.ContentFit.COVER,
@@ -278,15 +293,10 @@ class GalleryPage(Gtk.ScrolledWindow):
                 self._flow_child_count() - 1
             )
 
-        # Attach image metadata for deletion
+        # Attach image metadata for deletion, and the picture so child
+        # helpers don't have to walk the widget tree to find it
         child._image_info = image_info
-
-        # CAPTURE-phase gesture: intercepts before FlowBox default handling
-        gesture = Gtk.GestureClick()
-        gesture.set_button(0)  # Listen to all buttons
-        gesture.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        gesture.connect('pressed', self._on_child_pressed, child)
-        child.add_controller(gesture)
+        child._picture = picture
 
         return False
 
@@ -312,6 +322,18 @@ class GalleryPage(Gtk.ScrolledWindow):
             i += 1
         return children
 
+    def _on_flow_pressed(self, gesture, n_press, x, y):
+        """Route a press on the FlowBox to the child under the pointer."""
+        child = self._flow.get_child_at_pos(x, y)
+        if child is None:
+            return
+        # Popovers are anchored to the child, so use its coordinates
+        ok, bounds = child.compute_bounds(self._flow)
+        if ok:
+            x -= bounds.get_x()
+            y -= bounds.get_y()
+        self._on_child_pressed(gesture, n_press, x, y, child)
+
     def _on_child_pressed(self, gesture, n_press, x, y, child):
         """Handle left-click (with modifiers) and right-click."""
         button = gesture.get_current_button()
@@ -352,9 +374,18 @@ class GalleryPage(Gtk.ScrolledWindow):
             except ValueError:
                 i1, i2 = 0, 0
             start, end = min(i1, i2), max(i1, i2)
-            self._flow.unselect_all()
-            for c in children[start:end + 1]:
-                self._flow.select_child(c)
+            # Block the change signal so the range fires it once, not
+            # once per selected child
+            self._flow.handler_block_by_func(self._on_selection_changed)
+            try:
+                self._flow.unselect_all()
+                for c in children[start:end + 1]:
+                    self._flow.select_child(c)
+            finally:
+                self._flow.handler_unblock_by_func(
+                    self._on_selection_changed
+                )
+            self._on_selection_changed(self._flow)
         elif ctrl:
             # Toggle this child without affecting others
             if child.is_selected():
@@ -454,11 +485,13 @@ class GalleryPage(Gtk.ScrolledWindow):
             margin_start=4, margin_end=4
         )
 
-        pixbufs = [
-            pb for pb in
-            (self._pixbuf_from_child(c) for c in selected)
-            if pb
-        ]
+        # (pixbuf, file bytes, cache_path) for every selected child
+        # that loads; copy and save reuse the bytes read here
+        items = []
+        for c in selected:
+            pb, data = self._load_child(c)
+            if pb:
+                items.append((pb, data, self._cache_path_from_child(c)))
 
         def add_btn(label, cb):
             btn = Gtk.Button(label=label, has_frame=False)
@@ -466,21 +499,20 @@ class GalleryPage(Gtk.ScrolledWindow):
             btn.connect('clicked', lambda b: (popover.popdown(), cb()))
             box.append(btn)
 
-        if n == 1 and pixbufs:
-            pb = pixbufs[0]
-            path = self._cache_path_from_child(selected[0])
+        if n == 1 and items:
+            pb, data, path = items[0]
             if path:
                 add_btn('Open', lambda p=path: self._open_xdg(p))
             add_btn('Copy to Clipboard',
-                    lambda pb=pb: self._copy_to_clipboard(pb))
+                    lambda pb=pb, d=data: self._copy_to_clipboard(pb, d))
             add_btn('Save to\u2026',
-                    lambda pb=pb: self._save_single(pb, anchor_child))
-        elif n > 1 and pixbufs:
-            pbs = list(pixbufs)
+                    lambda pb=pb, d=data:
+                    self._save_single(pb, anchor_child, d))
+        elif n > 1 and items:
             add_btn(f'Copy {n} Images',
-                    lambda pbs=pbs: self._copy_multiple_to_clipboard(pbs))
+                    lambda it=items: self._copy_multiple_to_clipboard(it))
             add_btn(f'Save {n} images to folder\u2026',
-                    lambda pbs=pbs: self._save_multiple(pbs, anchor_child))
+                    lambda it=items: self._save_multiple(it, anchor_child))
 
         # Delete button styled to match presets/lora manager
         label = 'Delete' if n == 1 else f'Delete {n} images'
@@ -559,31 +591,60 @@ class GalleryPage(Gtk.ScrolledWindow):
         self._flow.set_focus_child(child)
         self._last_activated_child = child
 
-    def _copy_to_clipboard(self, pixbuf):
-        """Copy pixbuf to the system clipboard as an image."""
+    def _copy_to_clipboard(self, pixbuf, data=None):
+        """
+        Copy pixbuf to the system clipboard as an image. *data* is the
+        cached file's encoded bytes, if already read.
+        """
         texture = self._texture_from_pixbuf(pixbuf)
-
-        # Encode to PNG for maximum compatibility with other apps
-        success, buffer = pixbuf.save_to_bufferv("png", [], [])
-
-        if success:
-            gbytes = GLib.Bytes.new(buffer)
-            # Offer both the PNG bytes and the texture
-            content = Gdk.ContentProvider.new_union([
-                Gdk.ContentProvider.new_for_bytes("image/png", gbytes),
-                Gdk.ContentProvider.new_for_value(texture)
-            ])
+        providers = []
+
+        # The cached file is usually already a PNG: publish it as-is
+        # instead of re-encoding the decoded pixels
+        mime = self._encoded_mime(data)
+        if mime == "image/png":
+            providers.append(Gdk.ContentProvider.new_for_bytes(
+                "image/png", GLib.Bytes.new(data)
+            ))
         else:
-            content = Gdk.ContentProvider.new_for_value(texture)
+            # Encode to PNG for maximum compatibility with other apps.
+            # Level 1 deflate is much cheaper than the default of 6 and
+            # the clipboard copy is short-lived, so size hardly matters.
+            success, buffer = pixbuf.save_to_bufferv(
+                "png", ["compression"], [_CLIPBOARD_PNG_COMPRESSION]
+            )
+            if success:
+                providers.append(Gdk.ContentProvider.new_for_bytes(
+                    "image/png", GLib.Bytes.new(buffer)
+                ))
+
+        if mime == "image/jpeg":
+            # Original JPEG bytes, for apps that accept them natively
+            providers.append(Gdk.ContentProvider.new_for_bytes(
+                "image/jpeg", GLib.Bytes.new(data)
+            ))
+        elif mime is None and not pixbuf.get_has_alpha():
+            # Opaque images can also be offered as JPEG so apps that
+            # prefer it don't have to re-encode the PNG themselves
+            success, buffer = pixbuf.save_to_bufferv(
+                "jpeg", ["quality"], [_CLIPBOARD_JPEG_QUALITY]
+            )
+            if success:
+                providers.append(Gdk.ContentProvider.new_for_bytes(
+                    "image/jpeg", GLib.Bytes.new(buffer)
+                ))
 
+        providers.append(Gdk.ContentProvider.new_for_value(texture))
+        content = Gdk.ContentProvider.new_union(providers)
         self.get_clipboard().set_content(content)
 
-    def _copy_multiple_to_clipboard(self, pixbufs):
-        """Copy multiple images to the clipboard using their cache paths."""
-        selected = self._flow.get_selected_children()
+    def _copy_multiple_to_clipboard(self, items):
+        """
+        Copy multiple (pixbuf, data, cache_path) images to the
+        clipboard.
+        """
         file_list = []
-        for child in selected:
-            path = self._cache_path_from_child(child)
+        for _pb, _data, path in items:
             if path and path.exists():
                 file_list.append(Gio.File.new_for_path(str(path)))
 
@@ -595,9 +656,14 @@ class GalleryPage(Gtk.ScrolledWindow):
         content = Gdk.ContentProvider.new_for_value(gdk_file_list)
 
         # Fallback: first image as PNG bytes and texture for other apps
-        first_pb = pixbufs[0]
+        first_pb, data, _path = items[0]
         texture = self._texture_from_pixbuf(first_pb)
-        success, buffer = first_pb.save_to_bufferv("png", [], [])
+        if self._encoded_mime(data) == "image/png":
+            success, buffer = True, data
+        else:
+            success, buffer = first_pb.save_to_bufferv(
+                "png", ["compression"], [_CLIPBOARD_PNG_COMPRESSION]
+            )
 
         fallback_providers = [content,
                               Gdk.ContentProvider.new_for_value(texture)]
@@ -611,7 +677,7 @@ class GalleryPage(Gtk.ScrolledWindow):
         union_content = Gdk.ContentProvider.new_union(fallback_providers)
         self.get_clipboard().set_content(union_content)
 
-    def _save_single(self, pixbuf, anchor):
+    def _save_single(self, pixbuf, anchor, data=None):
         """Show a file-save dialog for a single image."""
         dialog = Gtk.FileChooserNative(
             title='Save Image',
@@ -623,23 +689,27 @@ class GalleryPage(Gtk.ScrolledWindow):
         dialog.set_current_name('image.png')
         dialog.connect(
             'response',
-            lambda d, r: self._on_save_single_response(d, r, pixbuf)
+            lambda d, r: self._on_save_single_response(
+                d, r, pixbuf, data
+            )
         )
         dialog.show()
 
-    def _on_save_single_response(self, dialog, response, pixbuf):
+    def _on_save_single_response(
+        self, dialog, response, pixbuf, data
+    ):
         if response == Gtk.ResponseType.ACCEPT:
             path = dialog.get_file().get_path()
             if not path.lower().endswith('.png'):
                 path += '.png'
             try:
-                pixbuf.savev(path, 'png', [], [])
+                self._save_png(pixbuf, data, path)
             except Exception as e:
                 print(f'Gallery save error: {e}', flush=True)
         dialog.destroy()
 
-    def _save_multiple(self, pixbufs, anchor):
-        """Show a folder chooser and save all pixbufs into it."""
+    def _save_multiple(self, items, anchor):
+        """Show a folder chooser and save all (pixbuf, data, path) items."""
         dialog = Gtk.FileChooserNative(
             title='Save Images to Folder',
             action=Gtk.FileChooserAction.SELECT_FOLDER,
@@ -649,21 +719,30 @@ class GalleryPage(Gtk.ScrolledWindow):
         )
         dialog.connect(
             'response',
-            lambda d, r: self._on_save_multiple_response(d, r, pixbufs)
+            lambda d, r: self._on_save_multiple_response(d, r, items)
         )
         dialog.show()
 
-    def _on_save_multiple_response(self, dialog, response, pixbufs):
+    def _on_save_multiple_response(self, dialog, response, items):
         if response == Gtk.ResponseType.ACCEPT:
             folder = dialog.get_file().get_path()
-            for i, pixbuf in enumerate(pixbufs, start=1):
+            for i, (pixbuf, data, _path) in enumerate(items, start=1):
                 path = os.path.join(folder, f'image_{i:03d}.png')
                 try:
-                    pixbuf.savev(path, 'png', [], [])
+                    self._save_png(pixbuf, data, path)
                 except Exception as e:
                     print(f'Gallery save error ({path}): {e}', flush=True)
         dialog.destroy()
 
+    def _save_png(self, pixbuf, data, dest):
+        """Write *pixbuf* to *dest* as PNG, writing the cached file's
+        bytes *data* as-is if they already are one."""
+        if self._encoded_mime(data) == "image/png":
+            with open(dest, 'wb') as f:
+                f.write(data)
+        else:
+            pixbuf.savev(dest, 'png', [], [])
+
     def _delete_children(self, children):
         """Request deletion of each child, calling the delete callback."""
         for child in children:
@@ -690,26 +769,32 @@ class GalleryPage(Gtk.ScrolledWindow):
 
     def _cache_path_from_child(self, child):
         """Extract the stored cache path from a FlowBoxChild."""
-        widget = child.get_child()
-        while widget:
-            if hasattr(widget, '_cache_path'):
-                return widget._cache_path
-            if hasattr(widget, 'get_child'):
-                widget = widget.get_child()
-            else:
-                break
-        return None
+        picture = getattr(child, '_picture', None)
+        return picture._cache_path if picture is not None else None
 
     def _pixbuf_from_child(self, child):
         """Lazy-load a full-res pixbuf from the child's cache path."""
+        return self._load_child(child)[0]
+
+    def _load_child(self, child):
+        """
+        Read the child's cached file and decode it at full size.
+
+        Returns (pixbuf, data), where data is the encoded file bytes,
+        or (None, None) if the image can't be loaded.
+        """
         path = self._cache_path_from_child(child)
         if path is None:
-            return None
+            return None, None
         try:
-            return self._pixbuf_from_bytes(path.read_bytes())
+            data = path.read_bytes()
         except Exception as e:
             print(f"Gallery: failed to load image: {e}", flush=True)
-            return None
+            return None, None
+        pixbuf = self._pixbuf_from_bytes(data)
+        if pixbuf is None:
+            return None, None
+        return pixbuf, data
 
     # ------------------------------------------------------------------
     # Static helpers
@@ -731,28 +816,50 @@ class GalleryPage(Gtk.ScrolledWindow):
     @staticmethod
     def _pixbuf_from_bytes(data: bytes):
         """Load a GdkPixbuf from raw bytes."""
-        loader = GdkPixbuf.PixbufLoader.new()
         try:
-            loader.write(data)
-            loader.close()
-            return loader.get_pixbuf()
+            stream = Gio.MemoryInputStream.new_from_bytes(
+                GLib.Bytes.new(data)
+            )
+            return GdkPixbuf.Pixbuf.new_from_stream(stream, None)
         except Exception:
-            try:
-                loader.close()
-            except Exception:
-                pass
             return None
 
     @staticmethod
-    def _scale_pixbuf(pixbuf, size: int):
-        """Scale pixbuf to fit within a square of *size* px."""
-        w, h = pixbuf.get_width(), pixbuf.get_height()
-        scale = size / max(w, h)
-        return pixbuf.scale_simple(
-            max(1, int(w * scale)),
-            max(1, int(h * scale)),
-            GdkPixbuf.InterpType.BILINEAR
-        )
+    def _encoded_mime(data):
+        """
+        Return the MIME type of encoded PNG or JPEG bytes.
+
+        Returns None when there is no data or it isn't a format that
+        can be passed through as-is.
+        """
+        if not data:
+            return None
+        if data[:8] == _PNG_MAGIC:
+            return "image/png"
+        if data[:3] == _JPEG_MAGIC:
+            return "image/jpeg"
+        return None
+
+    @staticmethod
+    def _thumbnail_from_bytes(data: bytes):
+        """
+        Decode PNG/JPEG bytes into a texture that fits within a square
+        of THUMBNAIL_SIZE px.
+
+        Safe to call from a background thread. The loader decodes
+        straight to thumbnail size, so full-size pixels are never kept
+        for a gallery item; returns None if decoding fails.
+        """
+        try:
+            stream = Gio.MemoryInputStream.new_from_bytes(
+                GLib.Bytes.new(data)
+            )
+            pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(
+                stream, THUMBNAIL_SIZE, THUMBNAIL_SIZE, True, None
+            )
+        except Exception:
+            return None
+        return GalleryPage._texture_from_pixbuf(pixbuf)
 
     @staticmethod
     def _texture_from_pixbuf(pixbuf):
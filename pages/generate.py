@@ -2,10 +2,17 @@ import json
 import uuid
 import threading
 import random
+import select
+import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import websocket
 import re
 import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import gi
 
 gi.require_version('Gtk', '4.0')
@@ -13,11 +20,20 @@ gi.require_version('Adw', '1')
 gi.require_version('GtkSource', '5')
 gi.require_version('Pango', '1.0')
 
-from gi.repository import Gtk, Adw, GLib, Gdk, GtkSource, Pango  # noqa
+from gi.repository import (  # noqa
+    Gtk, Adw, GLib, Gdk, Gio, GObject, GtkSource, Pango
+)
 import config  # noqa
+import image_cache  # noqa
 from tag_completion import TagCompletion  # noqa
 from widgets.node_settings import NodeSettingsDialog, default_node_settings  # noqa
 
+try:
+    # Optional C parser for the per-step websocket messages
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 CLIENT_ID = str(uuid.uuid4())
 
 # Workflow node class names
@@ -32,6 +48,34 @@ BRANCH_NODE_CLASS = "ImpactConditionalBranch"
 
 DETAILER_OPTIONS = ["None", "Face", "Nested"]
 
+# Concurrent object_info requests made when fetching node info
+NODE_INFO_WORKERS = 4
+
+# Pause in typing before tag completion is offered
+COMPLETION_DEBOUNCE_MS = 150
+
+# A weighted tag such as "(tag:1.2)"
+_WEIGHT_RE = re.compile(r"^\((.+?):(\d+\.?\d*)\)$")
+
+# Node classes whose inputs are patched for every queued job
+PATCHED_NODE_CLASSES = (
+    PROMPT_NODE_CLASS,
+    LOADER_NODE_CLASS,
+    BASE_NODE_CLASS,
+    UPSCALE_NODE_CLASS,
+    DETAILER_NODE_CLASS,
+    NESTED_DETAILER_NODE_CLASS,
+)
+
+
+class JobItem(GObject.Object):
+    """List store entry for a queued job."""
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self.added_at_str = job["added_at"].strftime("%H:%M:%S")
+
 
 def setup_comment_highlighting(buffer):
     """Apply the custom language definition for # comments."""
@@ -70,25 +114,58 @@ class GeneratePage:
         self.fallback_model_list = []
         self.upscale_model_list = []
         self.upscale_method_list = []
+        # Dropdown lists updated by the current node info fetch
+        self._lists_ready = set()
         self.workflow_data = None
+        # state.json is read once; saves keep this copy current
+        self._saved_state = config.load_state()
+        # class_type -> [node ids], rebuilt whenever a workflow loads
+        self._class_index = {}
+        self._nodes_by_class = {}
         self.node_settings = default_node_settings()
 
         self.tag_completion = TagCompletion(self.log)
 
         # Job queue state
-        self.job_list = []
+        # job id -> job, in queue order
+        self.job_list = OrderedDict()
+        # Jobs waiting to run, oldest first, for O(1) dequeue
+        self._pending_jobs = deque()
         self.job_list_lock = threading.Lock()
         self.current_job_id = None
         self.is_processing = False
-        self.debounce_timers = []
+        # (patches, order) for the most recently run batch
+        self._topo_cache = None
+        # Live completion timer source ids, removed on window close
+        self.debounce_timers = set()
+        self._rng = random.Random()
+        # The page is built on the GTK main thread
+        self._main_thread = threading.current_thread()
+        # Newly queued jobs waiting for their popover rows
+        self._pending_ui_jobs = deque()
+        self._ui_flush_scheduled = False
 
         # Stop control: event signals the queue loop to exit,
-        # _active_ws holds the live socket so stop() can close it
-        # immediately and unblock any blocking ws.recv() call.
+        # _active_ws holds the queue worker's socket, kept open across
+        # jobs, so stop() can close it immediately and unblock any
+        # blocking ws.recv() call.
         self._stop_requested = threading.Event()
         self._active_ws = None
         self._active_ws_lock = threading.Lock()
 
+        # Progress and preview updates waiting for the next idle flush
+        self._pending_progress = {}
+        self._progress_scheduled = False
+        self._progress_lock = threading.Lock()
+
+        # Pooled HTTP session so node-info, generation and interrupt
+        # calls reuse connections to the ComfyUI server
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=1, backoff_factor=0.1)
+        ))
+
         self._build_ui()
 
         self.tag_completion.load_tags()
@@ -400,24 +477,34 @@ class GeneratePage:
         )
         queue_btn_content.append(self.queue_label)
 
-        self._job_listbox = Gtk.ListBox(
-            selection_mode=Gtk.SelectionMode.NONE,
+        # Jobs live in a list store; the view only creates rows for
+        # the entries on screen and recycles them while scrolling
+        self._job_store = Gio.ListStore.new(JobItem)
+        self._job_store.connect("items-changed", self._on_job_store_changed)
+        job_factory = Gtk.SignalListItemFactory()
+        job_factory.connect("setup", self._on_job_item_setup)
+        job_factory.connect("bind", self._on_job_item_bind)
+        job_view = Gtk.ListView(
+            model=Gtk.NoSelection.new(self._job_store),
+            factory=job_factory,
             css_classes=["job-list"]
         )
-        self._job_listbox.set_placeholder(Gtk.Label(
+        self._job_placeholder = Gtk.Label(
             label="No jobs queued",
             css_classes=["dim-label"],
             margin_top=12,
             margin_bottom=12
-        ))
+        )
         popover_scroll = Gtk.ScrolledWindow(
             hscrollbar_policy=Gtk.PolicyType.NEVER,
             vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
             propagate_natural_height=True,
             min_content_height=0,
-            max_content_height=300
+            max_content_height=300,
+            visible=False
         )
-        popover_scroll.set_child(self._job_listbox)
+        popover_scroll.set_child(job_view)
+        self._job_scroll = popover_scroll
 
         popover_box = Gtk.Box(
             orientation=Gtk.Orientation.VERTICAL, spacing=6
@@ -430,6 +517,7 @@ class GeneratePage:
         popover_box.append(
             Gtk.Label(label="Queued Jobs", css_classes=["heading"])
         )
+        popover_box.append(self._job_placeholder)
         popover_box.append(popover_scroll)
 
         self._queue_popover = Gtk.Popover(
@@ -479,20 +567,17 @@ class GeneratePage:
 
         textview.completion_active = False
         textview.completion_debounce_id = None
+        textview.completion_deadline = 0
 
         key_ctrl = Gtk.EventControllerKey()
         key_ctrl.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
         key_ctrl.connect(
-            "key-pressed",
-            lambda ctrl, kv, kc, st: self._on_textview_key_press(
-                textview, kv, kc, st
-            )
+            "key-pressed", partial(self._on_textview_key_press, textview)
         )
         textview.add_controller(key_ctrl)
 
         buffer.connect(
-            "changed",
-            lambda buf: self._on_textview_changed(textview)
+            "changed", partial(self._on_textview_changed, textview)
         )
 
         scrolled = Gtk.ScrolledWindow(
@@ -507,10 +592,10 @@ class GeneratePage:
         # textview gains or loses keyboard focus.
         focus_ctrl = Gtk.EventControllerFocus()
         focus_ctrl.connect(
-            "enter", lambda _: scrolled.add_css_class("prompt-focused")
+            "enter", partial(self._on_prompt_focus, scrolled, True)
         )
         focus_ctrl.connect(
-            "leave", lambda _: scrolled.remove_css_class("prompt-focused")
+            "leave", partial(self._on_prompt_focus, scrolled, False)
         )
         textview.add_controller(focus_ctrl)
 
@@ -536,11 +621,26 @@ class GeneratePage:
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 self.workflow_data = json.load(f)
+            self._index_workflow()
             self.sync_ui_from_json()
             self.log(f"Loaded workflow: {filepath}")
         except Exception as e:
             self.log(f"Error loading workflow: {e}")
 
+    def _index_workflow(self):
+        """Index the loaded workflow's node ids by class_type."""
+        index = {}
+        for nid, node in self.workflow_data.items():
+            index.setdefault(node.get("class_type"), []).append(nid)
+        self._class_index = index
+        self._nodes_by_class = {
+            ct: index[ct] for ct in PATCHED_NODE_CLASSES if ct in index
+        }
+
+    def _first_node_id(self, class_type):
+        """Return the first node id of a class, or None."""
+        return self._class_index.get(class_type, [None])[0]
+
     def insert_character(self, name):
         """Append a character tag to the positive prompt."""
         tag = f"character:{name}:default:top, "
@@ -619,37 +719,48 @@ class GeneratePage:
 
     def _fetch_node_info_worker(self):
         """Worker thread: fetch styles, models, and resolutions."""
-        self._fetch_input_list(
-            PROMPT_NODE_CLASS, "style",
-            self.update_style_dropdown, "Metadata"
-        )
-        self._fetch_input_list(
-            LOADER_NODE_CLASS, "ckpt_name",
-            self.update_model_dropdown, "Model metadata"
-        )
-        self._fetch_input_list(
-            BASE_NODE_CLASS, "resolution",
-            self.update_resolution_dropdown, "Resolution metadata"
-        )
-        # Fetch enum lists used by the node settings dialog.
-        # Use BaseNode rather than KSampler so custom schedulers/samplers
-        # registered by custom nodes are included.
-        samplers = self._fetch_enum(BASE_NODE_CLASS, 'sampler_name')
-        schedulers = self._fetch_enum(BASE_NODE_CLASS, 'scheduler')
-        bbox = self._fetch_enum('DetailerPipeNode', 'bbox_model')
-        fallback = self._fetch_enum(
-            'DetailerPipeNode', 'fallback_model'
-        )
-        up_models = self._fetch_enum(
-            'DetailerPipeNode', 'upscale_model'
-        )
-        up_methods = self._fetch_enum(
-            'DetailerPipeNode', 'upscale_method'
-        )
+        # The requests are independent, so run them concurrently and
+        # wait on the slowest rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=NODE_INFO_WORKERS) as ex:
+            for args in (
+                (PROMPT_NODE_CLASS, "style",
+                 self.update_style_dropdown, "Metadata"),
+                (LOADER_NODE_CLASS, "ckpt_name",
+                 self.update_model_dropdown, "Model metadata"),
+                (BASE_NODE_CLASS, "resolution",
+                 self.update_resolution_dropdown, "Resolution metadata"),
+            ):
+                ex.submit(self._fetch_input_list, *args)
+            # Fetch enum lists used by the node settings dialog.
+            # Use BaseNode rather than KSampler so custom
+            # schedulers/samplers registered by custom nodes are
+            # included.
+            enums = [
+                ex.submit(self._fetch_enum, node_class, key)
+                for node_class, key in (
+                    (BASE_NODE_CLASS, 'sampler_name'),
+                    (BASE_NODE_CLASS, 'scheduler'),
+                    ('DetailerPipeNode', 'bbox_model'),
+                    ('DetailerPipeNode', 'fallback_model'),
+                    ('DetailerPipeNode', 'upscale_model'),
+                    ('DetailerPipeNode', 'upscale_method'),
+                )
+            ]
         GLib.idle_add(
-            self._store_enum_lists,
-            samplers, schedulers, bbox, fallback, up_models, up_methods
-        )
+            self._store_enum_lists, *(f.result() for f in enums)
+        )
+        # Queued after the dropdown updates, so it runs once they have
+        # all been applied
+        GLib.idle_add(self._on_node_lists_fetched)
+
+    def _on_node_lists_fetched(self):
+        """Apply workflow and saved values once per node info fetch."""
+        if self._lists_ready:
+            self._lists_ready.clear()
+            if self.workflow_data:
+                self.sync_ui_from_json()
+            self.load_saved_state()
+        return False
 
     def _fetch_enum(self, node_class, key):
         """Fetch a single enum list from object_info; return [] on fail."""
@@ -658,10 +769,10 @@ class GeneratePage:
                 f"http://{config.server_address()}"
                 f"/object_info/{node_class}"
             )
-            resp = requests.get(url, timeout=3)
-            if resp.status_code != 200:
-                return []
-            data = resp.json().get(node_class, {})
+            with self._http.get(url, timeout=3) as resp:
+                if resp.status_code != 200:
+                    return []
+                data = resp.json().get(node_class, {})
             inputs = data.get("input", {})
             for cat in ("required", "optional"):
                 entry = inputs.get(cat, {}).get(key)
@@ -676,7 +787,6 @@ class GeneratePage:
                         and isinstance(entry[1], dict)
                         and "options" in entry[1]):
                     return entry[1]["options"]
-            resp.close()
         except Exception as e:
             self.log(f"Enum fetch {node_class}/{key}: {e}")
         return []
@@ -699,49 +809,70 @@ class GeneratePage:
                 f"http://{config.server_address()}"
                 f"/object_info/{node_class}"
             )
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
+            with self._http.get(url, timeout=3) as resp:
+                if resp.status_code != 200:
+                    return
                 data = resp.json().get(node_class, {})
-                inputs = data.get("input", {})
-                result = None
-                for cat in ("required", "optional"):
-                    if key in inputs.get(cat, {}):
-                        entry = inputs[cat][key]
-                        result = (
-                            entry[0]
-                            if isinstance(entry, list)
-                            and isinstance(entry[0], list)
-                            else entry
-                        )
-                        break
-                if result:
-                    GLib.idle_add(callback, result)
-            resp.close()
+            inputs = data.get("input", {})
+            result = None
+            for cat in ("required", "optional"):
+                if key in inputs.get(cat, {}):
+                    entry = inputs[cat][key]
+                    result = (
+                        entry[0]
+                        if isinstance(entry, list)
+                        and isinstance(entry[0], list)
+                        else entry
+                    )
+                    break
+            if result:
+                GLib.idle_add(callback, result)
         except Exception as e:
             self.log(f"{label} fail: {e}")
 
+    @staticmethod
+    def _replace_strings(dropdown, old, new):
+        """
+        Update a dropdown's StringList from old to new in place.
+
+        Only the span between the common prefix and suffix is spliced,
+        and the selected string stays selected if it is still listed.
+        """
+        idx = dropdown.get_selected()
+        selected = old[idx] if idx < len(old) else None
+
+        n = min(len(old), len(new))
+        start = 0
+        while start < n and old[start] == new[start]:
+            start += 1
+        tail = 0
+        while tail < n - start and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        if start < len(old) - tail or start < len(new) - tail:
+            dropdown.get_model().splice(
+                start, len(old) - start - tail,
+                new[start:len(new) - tail]
+            )
+
+        if selected in new:
+            dropdown.set_selected(new.index(selected))
+
     def update_style_dropdown(self, styles):
+        self._replace_strings(self.style_dropdown, self.style_list, styles)
         self.style_list = styles
-        self.style_dropdown.set_model(Gtk.StringList.new(styles))
-        if self.workflow_data:
-            self.sync_ui_from_json()
-        self.load_saved_state()
+        self._lists_ready.add("style")
 
     def update_model_dropdown(self, models):
+        self._replace_strings(self.model_dropdown, self.model_list, models)
         self.model_list = models
-        self.model_dropdown.set_model(Gtk.StringList.new(models))
-        if self.workflow_data:
-            self.sync_ui_from_json()
-        self.load_saved_state()
+        self._lists_ready.add("model")
 
     def update_resolution_dropdown(self, resolutions):
-        self.resolution_list = resolutions
-        self.resolution_dropdown.set_model(
-            Gtk.StringList.new(resolutions)
+        self._replace_strings(
+            self.resolution_dropdown, self.resolution_list, resolutions
         )
-        if self.workflow_data:
-            self.sync_ui_from_json()
-        self.load_saved_state()
+        self.resolution_list = resolutions
+        self._lists_ready.add("resolution")
 
     # ------------------------------------------------------------------
     # Node settings dialog
@@ -773,120 +904,119 @@ class GeneratePage:
         if not self.workflow_data:
             return
 
-        # Pre-find IDs needed for detailer inference
-        upscale_id = next(
-            (nid for nid, n in self.workflow_data.items()
-             if n.get("class_type") == UPSCALE_NODE_CLASS), None
+        handlers = {
+            PROMPT_NODE_CLASS: self._sync_prompt_node,
+            LOADER_NODE_CLASS: self._sync_loader_node,
+            BASE_NODE_CLASS: self._sync_base_node,
+            UPSCALE_NODE_CLASS: self._sync_upscale_node,
+            DETAILER_NODE_CLASS: self._sync_detailer_node,
+            NESTED_DETAILER_NODE_CLASS: self._sync_nested_node,
+            BRANCH_NODE_CLASS: self._sync_branch_node,
+        }
+        for node in self.workflow_data.values():
+            handler = handlers.get(node.get("class_type"))
+            if handler:
+                handler(node["inputs"])
+
+    def _sync_prompt_node(self, inp):
+        self.pos_buffer.set_text(str(inp.get("positive", "")))
+        self.neg_buffer.set_text(str(inp.get("negative", "")))
+        style_val = inp.get("style")
+        if style_val in self.style_list:
+            self.style_dropdown.set_selected(
+                self.style_list.index(style_val)
+            )
+        self.quality_tags_toggle.set_active(
+            bool(inp.get("quality_tags", False))
         )
-        detailer_id = next(
-            (nid for nid, n in self.workflow_data.items()
-             if n.get("class_type") == DETAILER_NODE_CLASS), None
+        self.embeddings_toggle.set_active(
+            bool(inp.get("embeddings", False))
         )
 
-        for node in self.workflow_data.values():
-            ct = node.get("class_type")
-            inp = node["inputs"]
-
-            if ct == PROMPT_NODE_CLASS:
-                self.pos_buffer.set_text(str(inp.get("positive", "")))
-                self.neg_buffer.set_text(str(inp.get("negative", "")))
-                style_val = inp.get("style")
-                if style_val in self.style_list:
-                    self.style_dropdown.set_selected(
-                        self.style_list.index(style_val)
-                    )
-                self.quality_tags_toggle.set_active(
-                    bool(inp.get("quality_tags", False))
-                )
-                self.embeddings_toggle.set_active(
-                    bool(inp.get("embeddings", False))
-                )
+    def _sync_loader_node(self, inp):
+        self.seed_adj.set_value(float(inp.get("seed", 0)))
+        model_val = inp.get("ckpt_name")
+        if model_val in self.model_list:
+            self.model_dropdown.set_selected(
+                self.model_list.index(model_val)
+            )
 
-            elif ct == LOADER_NODE_CLASS:
-                self.seed_adj.set_value(float(inp.get("seed", 0)))
-                model_val = inp.get("ckpt_name")
-                if model_val in self.model_list:
-                    self.model_dropdown.set_selected(
-                        self.model_list.index(model_val)
-                    )
+    def _sync_base_node(self, inp):
+        res_val = inp.get("resolution")
+        if res_val in self.resolution_list:
+            self.resolution_dropdown.set_selected(
+                self.resolution_list.index(res_val)
+            )
+        self.portrait_toggle.set_active(bool(inp.get("portrait", False)))
+        ns = self.node_settings["base"]
+        ns["sampler_name"] = inp.get("sampler_name", ns["sampler_name"])
+        ns["scheduler"] = inp.get("scheduler", ns["scheduler"])
+        ns["steps"] = inp.get("steps", ns["steps"])
+        ns["cfg"] = inp.get("cfg", ns["cfg"])
+        ns["denoise"] = inp.get("denoise", ns["denoise"])
+
+    def _sync_upscale_node(self, inp):
+        ns = self.node_settings["upscale"]
+        ns["sampler_name"] = inp.get("sampler_name", ns["sampler_name"])
+        ns["scheduler"] = inp.get("scheduler", ns["scheduler"])
+        ns["steps"] = inp.get("steps", ns["steps"])
+        ns["cfg"] = inp.get("cfg", ns["cfg"])
+        ns["denoise"] = inp.get("denoise", ns["denoise"])
+        ns["upscale_model"] = inp.get(
+            "upscale_model", ns["upscale_model"]
+        )
+        ns["scale_by"] = inp.get("scale_by", ns["scale_by"])
+
+    def _sync_detailer_node(self, inp):
+        ns = self.node_settings["detailer"]
+        for key in (
+            "bbox_model", "fallback_model", "threshold",
+            "steps", "cfg", "sampler", "scheduler", "denoise",
+            "upscale_method", "upscale_model",
+            "feather", "context_padding"
+        ):
+            if key in inp:
+                ns[key] = inp[key]
+
+    def _sync_nested_node(self, inp):
+        ns = self.node_settings["nested"]
+        for key in (
+            "face_model", "eyes_pair_model", "eye_single_model",
+            "threshold", "cfg", "sampler", "scheduler",
+            "face_steps", "face_denoise", "face_scale",
+            "eye_steps", "eye_denoise", "eye_scale",
+            "upscale_method", "max_megapixels",
+            "feather", "context_padding"
+        ):
+            if key in inp:
+                ns[key] = inp[key]
+
+    def _sync_branch_node(self, inp):
+        # Infer detailer mode from cond and ff_value target
+        detailer_id = self._first_node_id(DETAILER_NODE_CLASS)
+        cond = inp.get("cond", False)
+        ff_src = inp.get("ff_value", [None])[0]
+        if cond:
+            self.detailer_dropdown.set_selected(2)  # Nested
+        elif str(ff_src) == str(detailer_id):
+            self.detailer_dropdown.set_selected(1)  # Face
+        else:
+            self.detailer_dropdown.set_selected(0)  # None
 
-            elif ct == BASE_NODE_CLASS:
-                res_val = inp.get("resolution")
-                if res_val in self.resolution_list:
-                    self.resolution_dropdown.set_selected(
-                        self.resolution_list.index(res_val)
-                    )
-                self.portrait_toggle.set_active(
-                    bool(inp.get("portrait", False))
-                )
-                ns = self.node_settings["base"]
-                ns["sampler_name"] = inp.get(
-                    "sampler_name", ns["sampler_name"]
-                )
-                ns["scheduler"] = inp.get("scheduler", ns["scheduler"])
-                ns["steps"] = inp.get("steps", ns["steps"])
-                ns["cfg"] = inp.get("cfg", ns["cfg"])
-                ns["denoise"] = inp.get("denoise", ns["denoise"])
+    def _read_prompts(self):
+        """Return the (positive, negative) prompt text."""
+        pos = self.pos_buffer.get_text(*self.pos_buffer.get_bounds(), False)
+        neg = self.neg_buffer.get_text(*self.neg_buffer.get_bounds(), False)
+        return pos, neg
 
-            elif ct == UPSCALE_NODE_CLASS:
-                ns = self.node_settings["upscale"]
-                ns["sampler_name"] = inp.get(
-                    "sampler_name", ns["sampler_name"]
-                )
-                ns["scheduler"] = inp.get("scheduler", ns["scheduler"])
-                ns["steps"] = inp.get("steps", ns["steps"])
-                ns["cfg"] = inp.get("cfg", ns["cfg"])
-                ns["denoise"] = inp.get("denoise", ns["denoise"])
-                ns["upscale_model"] = inp.get(
-                    "upscale_model", ns["upscale_model"]
-                )
-                ns["scale_by"] = inp.get("scale_by", ns["scale_by"])
+    def save_current_state(self, prompts=None):
+        """
+        Persist current input values to state.json.
 
-            elif ct == DETAILER_NODE_CLASS:
-                ns = self.node_settings["detailer"]
-                for key in (
-                    "bbox_model", "fallback_model", "threshold",
-                    "steps", "cfg", "sampler", "scheduler", "denoise",
-                    "upscale_method", "upscale_model",
-                    "feather", "context_padding"
-                ):
-                    if key in inp:
-                        ns[key] = inp[key]
-
-            elif ct == NESTED_DETAILER_NODE_CLASS:
-                ns = self.node_settings["nested"]
-                for key in (
-                    "face_model", "eyes_pair_model", "eye_single_model",
-                    "threshold", "cfg", "sampler", "scheduler",
-                    "face_steps", "face_denoise", "face_scale",
-                    "eye_steps", "eye_denoise", "eye_scale",
-                    "upscale_method", "max_megapixels",
-                    "feather", "context_padding"
-                ):
-                    if key in inp:
-                        ns[key] = inp[key]
-
-            elif ct == BRANCH_NODE_CLASS:
-                # Infer detailer mode from cond and ff_value target
-                cond = inp.get("cond", False)
-                ff_src = inp.get("ff_value", [None])[0]
-                if cond:
-                    self.detailer_dropdown.set_selected(2)  # Nested
-                elif str(ff_src) == str(detailer_id):
-                    self.detailer_dropdown.set_selected(1)  # Face
-                else:
-                    self.detailer_dropdown.set_selected(0)  # None
-
-    def save_current_state(self):
-        """Persist current input values to state.json."""
-        pos = self.pos_buffer.get_text(
-            self.pos_buffer.get_start_iter(),
-            self.pos_buffer.get_end_iter(), False
-        )
-        neg = self.neg_buffer.get_text(
-            self.neg_buffer.get_start_iter(),
-            self.neg_buffer.get_end_iter(), False
-        )
+        prompts is an already-read (positive, negative) pair; the
+        buffers are read when it is omitted.
+        """
+        pos, neg = prompts if prompts else self._read_prompts()
 
         def _dropdown_val(dropdown, lst):
             idx = dropdown.get_selected()
@@ -908,16 +1038,21 @@ class GeneratePage:
             "detailer": DETAILER_OPTIONS[
                 self.detailer_dropdown.get_selected()
             ],
-            "node_settings": self.node_settings,
+            # Copied so later edits can't race the background writer
+            "node_settings": {
+                section: dict(values)
+                for section, values in self.node_settings.items()
+            },
             "positive": pos,
             "negative": neg,
             "qs_expanded": self._qs_expanded,
         }
-        config.save_state(state)
+        self._saved_state = state
+        config.save_state_async(state)
 
     def load_saved_state(self):
-        """Restore input values from state.json if it exists."""
-        state = config.load_state()
+        """Restore input values saved in state.json."""
+        state = self._saved_state
         if not state:
             return
 
@@ -983,11 +1118,48 @@ class GeneratePage:
         """Update the current-node status label."""
         self.current_node_label.set_text(text if text else "Ready")
 
+    def _schedule_progress(self, **updates):
+        """
+        Coalesce progress, node label and preview updates from the
+        worker.
+
+        updates may hold fraction, node and/or preview (encoded image
+        bytes); only the latest value of each is applied, by a single
+        pending idle callback. Preview frames that arrive faster than
+        the main loop can decode them are dropped.
+        """
+        with self._progress_lock:
+            self._pending_progress.update(updates)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        GLib.idle_add(self._flush_progress)
+
+    def _flush_progress(self):
+        with self._progress_lock:
+            updates = self._pending_progress
+            self._pending_progress = {}
+            self._progress_scheduled = False
+        if "node" in updates:
+            self.set_current_node(updates["node"])
+        if "fraction" in updates:
+            self.progress_bar.set_fraction(updates["fraction"])
+        if "preview" in updates:
+            self._on_image_update(updates["preview"])
+        return False
+
     def update_queue_label(self):
         """Schedule a UI update for the queue count badge."""
         with self.job_list_lock:
             count = len(self.job_list)
-        GLib.idle_add(self._update_queue_label_ui, str(count), count)
+        self._run_on_ui(self._update_queue_label_ui, str(count), count)
+
+    def _run_on_ui(self, fn, *args):
+        """Call fn now on the main thread, otherwise via idle_add."""
+        if threading.current_thread() is self._main_thread:
+            fn(*args)
+        else:
+            GLib.idle_add(fn, *args)
 
     def _update_queue_label_ui(self, text, count):
         self.queue_label.set_text(text)
@@ -998,42 +1170,88 @@ class GeneratePage:
             if self.queue_box.has_css_class("queue-active"):
                 self.queue_box.remove_css_class("queue-active")
 
-    def _add_job_row(self, job):
-        """Create and prepend a row for the job in the queue popover."""
+    def _on_job_item_setup(self, factory, list_item):
+        """Build a reusable row for the queue popover list."""
         row_box = Gtk.Box(
             orientation=Gtk.Orientation.HORIZONTAL,
             spacing=8,
             margin_top=6, margin_bottom=6,
             margin_start=6, margin_end=6
         )
-        time_label = Gtk.Label(
-            label=job["added_at"].strftime("%H:%M:%S"),
-            hexpand=True, xalign=0
-        )
-        row_box.append(time_label)
+        row_box.append(Gtk.Label(hexpand=True, xalign=0))
 
         cancel_btn = Gtk.Button(
             icon_name="window-close-symbolic",
             css_classes=["flat", "circular"],
             valign=Gtk.Align.CENTER
         )
-        cancel_btn.connect("clicked", lambda b: self._cancel_job(job))
+        cancel_btn.connect("clicked", self._on_job_cancel_clicked, list_item)
         row_box.append(cancel_btn)
+        list_item.set_child(row_box)
+
+    def _on_job_item_bind(self, factory, list_item):
+        """Show a job's queue time and processing state in its row."""
+        item = list_item.get_item()
+        row_box = list_item.get_child()
+        row_box.get_first_child().set_label(item.added_at_str)
+        if item.job["status"] == "processing":
+            row_box.add_css_class("job-processing")
+        else:
+            row_box.remove_css_class("job-processing")
+
+    def _on_job_cancel_clicked(self, _button, list_item):
+        item = list_item.get_item()
+        if item is not None:
+            self._cancel_job(item.job)
+
+    def _on_job_store_changed(self, store, _pos, _removed, _added):
+        has_jobs = store.get_n_items() > 0
+        self._job_scroll.set_visible(has_jobs)
+        self._job_placeholder.set_visible(not has_jobs)
+
+    def _queue_job_row(self, job):
+        """Defer a job's row so a batch is added in one idle pass."""
+        self._pending_ui_jobs.append(job)
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            GLib.idle_add(
+                self._flush_ui_jobs, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _flush_ui_jobs(self):
+        """Add rows for all deferred jobs and refresh the badge once."""
+        self._ui_flush_scheduled = False
+        items = []
+        while self._pending_ui_jobs:
+            job = self._pending_ui_jobs.popleft()
+            job["item"] = JobItem(job)
+            items.append(job["item"])
+        # Newest first, inserted with a single items-changed emission
+        self._job_store.splice(0, 0, items[::-1])
+        with self.job_list_lock:
+            count = len(self.job_list)
+        self._update_queue_label_ui(str(count), count)
+        return False
 
-        row = Gtk.ListBoxRow()
-        row.set_child(row_box)
-        job["row"] = row
-        self._job_listbox.prepend(row)
-        row.show()
+    def _job_position(self, job):
+        """Return the job's position in the list store, or None."""
+        item = job.get("item")
+        if item is None:
+            return None
+        found, pos = self._job_store.find(item)
+        return pos if found else None
 
     def _remove_job_row_widget(self, job):
-        if job.get("row"):
-            self._job_listbox.remove(job["row"])
+        pos = self._job_position(job)
+        if pos is not None:
+            self._job_store.remove(pos)
         return False
 
     def _mark_job_processing(self, job):
-        if job.get("row"):
-            job["row"].add_css_class("job-processing")
+        pos = self._job_position(job)
+        if pos is not None:
+            # Rebind the row so it picks up the processing style
+            self._job_store.items_changed(pos, 1, 1)
         return False
 
     def _cancel_job(self, job):
@@ -1046,13 +1264,9 @@ class GeneratePage:
         if status == "processing":
             self.on_stop_clicked(None)
         else:
-            if job.get("row"):
-                self._job_listbox.remove(job["row"])
+            self._remove_job_row_widget(job)
             with self.job_list_lock:
-                try:
-                    self.job_list.remove(job)
-                except ValueError:
-                    pass
+                self.job_list.pop(job["id"], None)
             self.update_queue_label()
 
     # ------------------------------------------------------------------
@@ -1073,10 +1287,10 @@ class GeneratePage:
                     pass
 
         try:
-            requests.post(
+            self._http.post(
                 f"http://{config.server_address()}/interrupt",
                 timeout=5
-            )
+            ).close()
             self.log("Interrupt signal sent.")
         except Exception as e:
             self.log(f"Stop error: {e}")
@@ -1086,16 +1300,8 @@ class GeneratePage:
         if not self.workflow_data:
             return
 
-        self.save_current_state()
-
-        pos = self.pos_buffer.get_text(
-            self.pos_buffer.get_start_iter(),
-            self.pos_buffer.get_end_iter(), False
-        )
-        neg = self.neg_buffer.get_text(
-            self.neg_buffer.get_start_iter(),
-            self.neg_buffer.get_end_iter(), False
-        )
+        pos, neg = self._read_prompts()
+        self.save_current_state((pos, neg))
 
         def _dd(dropdown, lst):
             idx = dropdown.get_selected()
@@ -1117,136 +1323,134 @@ class GeneratePage:
         randomize = self.seed_mode_combo.get_selected() == 0
         base_seed = int(self.seed_adj.get_value())
 
+        base = self.workflow_data
+        nodes_by_class = self._nodes_by_class
+        upscale_nid = self._first_node_id(UPSCALE_NODE_CLASS)
+        detailer_nid = self._first_node_id(DETAILER_NODE_CLASS)
+        branch_nid = self._first_node_id(BRANCH_NODE_CLASS)
+
+        # Inputs shared by every job in the batch; only the seed
+        # differs per job
+        class_patches = {}
+        for ct in nodes_by_class:
+            if ct == PROMPT_NODE_CLASS:
+                patch = {
+                    "positive": pos,
+                    "negative": neg,
+                    "quality_tags": quality_tags,
+                    "embeddings": embeddings,
+                }
+                if style:
+                    patch["style"] = style
+            elif ct == LOADER_NODE_CLASS:
+                patch = {}
+                if model:
+                    patch["ckpt_name"] = model
+            elif ct == BASE_NODE_CLASS:
+                bns = self.node_settings["base"]
+                patch = {
+                    "portrait": portrait,
+                    "sampler_name": bns["sampler_name"],
+                    "scheduler": bns["scheduler"],
+                    "steps": int(bns["steps"]),
+                    "cfg": bns["cfg"],
+                    "denoise": bns["denoise"],
+                }
+                if resolution:
+                    patch["resolution"] = resolution
+            elif ct == UPSCALE_NODE_CLASS:
+                uns = self.node_settings["upscale"]
+                patch = {
+                    "sampler_name": uns["sampler_name"],
+                    "scheduler": uns["scheduler"],
+                    "steps": int(uns["steps"]),
+                    "cfg": uns["cfg"],
+                    "denoise": uns["denoise"],
+                    "upscale_model": uns["upscale_model"],
+                    "scale_by": uns["scale_by"],
+                }
+            elif ct == DETAILER_NODE_CLASS:
+                dns = self.node_settings["detailer"]
+                patch = {
+                    "bbox_model": dns["bbox_model"],
+                    "fallback_model": dns["fallback_model"],
+                    "threshold": dns["threshold"],
+                    "steps": int(dns["steps"]),
+                    "cfg": dns["cfg"],
+                    "sampler": dns["sampler"],
+                    "scheduler": dns["scheduler"],
+                    "denoise": dns["denoise"],
+                    "upscale_method": dns["upscale_method"],
+                    "upscale_model": dns["upscale_model"],
+                    "feather": dns["feather"],
+                    "context_padding": dns["context_padding"],
+                }
+            elif ct == NESTED_DETAILER_NODE_CLASS:
+                nns = self.node_settings["nested"]
+                patch = {
+                    "face_model": nns["face_model"],
+                    "eyes_pair_model": nns["eyes_pair_model"],
+                    "eye_single_model": nns["eye_single_model"],
+                    "threshold": nns["threshold"],
+                    "cfg": nns["cfg"],
+                    "sampler": nns["sampler"],
+                    "scheduler": nns["scheduler"],
+                    "face_steps": int(nns["face_steps"]),
+                    "face_denoise": nns["face_denoise"],
+                    "face_scale": nns["face_scale"],
+                    "eye_steps": int(nns["eye_steps"]),
+                    "eye_denoise": nns["eye_denoise"],
+                    "eye_scale": nns["eye_scale"],
+                    "upscale_method": nns["upscale_method"],
+                    "max_megapixels": nns["max_megapixels"],
+                    "feather": nns["feather"],
+                    "context_padding": nns["context_padding"],
+                }
+            class_patches[ct] = patch
+
+        # Apply detailer mode by patching the branch node
+        branch_patch = None
+        if branch_nid and detailer_nid and upscale_nid:
+            if detailer == "None":
+                branch_patch = {
+                    "cond": False, "ff_value": [upscale_nid, 0]
+                }
+            elif detailer == "Face":
+                branch_patch = {
+                    "cond": False, "ff_value": [detailer_nid, 0]
+                }
+            else:  # Nested
+                branch_patch = {
+                    "cond": True, "ff_value": [detailer_nid, 0]
+                }
+
         for i in range(batch_count):
             seed = (
-                random.randint(0, 2**32)
+                self._rng.getrandbits(32)
                 if randomize or i > 0
                 else base_seed
             )
             if i == 0:
-                GLib.idle_add(self.seed_adj.set_value, float(seed))
-
-            wf = json.loads(json.dumps(self.workflow_data))
-
-            for node in wf.values():
-                ct = node.get("class_type")
-                if ct == PROMPT_NODE_CLASS:
-                    node["inputs"].update(
-                        {"positive": pos, "negative": neg}
-                    )
-                    if style:
-                        node["inputs"]["style"] = style
-                    node["inputs"]["quality_tags"] = quality_tags
-                    node["inputs"]["embeddings"] = embeddings
-                elif ct == LOADER_NODE_CLASS:
-                    node["inputs"]["seed"] = seed
-                    if model:
-                        node["inputs"]["ckpt_name"] = model
-                elif ct == BASE_NODE_CLASS:
-                    if resolution:
-                        node["inputs"]["resolution"] = resolution
-                    node["inputs"]["portrait"] = portrait
-                    bns = self.node_settings["base"]
-                    node["inputs"]["sampler_name"] = bns["sampler_name"]
-                    node["inputs"]["scheduler"] = bns["scheduler"]
-                    node["inputs"]["steps"] = int(bns["steps"])
-                    node["inputs"]["cfg"] = bns["cfg"]
-                    node["inputs"]["denoise"] = bns["denoise"]
-                elif ct == UPSCALE_NODE_CLASS:
-                    uns = self.node_settings["upscale"]
-                    node["inputs"]["sampler_name"] = uns["sampler_name"]
-                    node["inputs"]["scheduler"] = uns["scheduler"]
-                    node["inputs"]["steps"] = int(uns["steps"])
-                    node["inputs"]["cfg"] = uns["cfg"]
-                    node["inputs"]["denoise"] = uns["denoise"]
-                    node["inputs"]["upscale_model"] = uns["upscale_model"]
-                    node["inputs"]["scale_by"] = uns["scale_by"]
-                elif ct == DETAILER_NODE_CLASS:
-                    dns = self.node_settings["detailer"]
-                    node["inputs"]["bbox_model"] = dns["bbox_model"]
-                    node["inputs"]["fallback_model"] = (
-                        dns["fallback_model"]
-                    )
-                    node["inputs"]["threshold"] = dns["threshold"]
-                    node["inputs"]["steps"] = int(dns["steps"])
-                    node["inputs"]["cfg"] = dns["cfg"]
-                    node["inputs"]["sampler"] = dns["sampler"]
-                    node["inputs"]["scheduler"] = dns["scheduler"]
-                    node["inputs"]["denoise"] = dns["denoise"]
-                    node["inputs"]["upscale_method"] = (
-                        dns["upscale_method"]
-                    )
-                    node["inputs"]["upscale_model"] = dns["upscale_model"]
-                    node["inputs"]["feather"] = dns["feather"]
-                    node["inputs"]["context_padding"] = (
-                        dns["context_padding"]
-                    )
-                elif ct == NESTED_DETAILER_NODE_CLASS:
-                    nns = self.node_settings["nested"]
-                    node["inputs"]["face_model"] = nns["face_model"]
-                    node["inputs"]["eyes_pair_model"] = (
-                        nns["eyes_pair_model"]
-                    )
-                    node["inputs"]["eye_single_model"] = (
-                        nns["eye_single_model"]
-                    )
-                    node["inputs"]["threshold"] = nns["threshold"]
-                    node["inputs"]["cfg"] = nns["cfg"]
-                    node["inputs"]["sampler"] = nns["sampler"]
-                    node["inputs"]["scheduler"] = nns["scheduler"]
-                    node["inputs"]["face_steps"] = int(nns["face_steps"])
-                    node["inputs"]["face_denoise"] = nns["face_denoise"]
-                    node["inputs"]["face_scale"] = nns["face_scale"]
-                    node["inputs"]["eye_steps"] = int(nns["eye_steps"])
-                    node["inputs"]["eye_denoise"] = nns["eye_denoise"]
-                    node["inputs"]["eye_scale"] = nns["eye_scale"]
-                    node["inputs"]["upscale_method"] = (
-                        nns["upscale_method"]
-                    )
-                    node["inputs"]["max_megapixels"] = (
-                        nns["max_megapixels"]
-                    )
-                    node["inputs"]["feather"] = nns["feather"]
-                    node["inputs"]["context_padding"] = (
-                        nns["context_padding"]
-                    )
-
-            # Apply detailer mode by patching the branch node
-            upscale_nid = next(
-                (nid for nid, n in wf.items()
-                 if n.get("class_type") == UPSCALE_NODE_CLASS), None
-            )
-            detailer_nid = next(
-                (nid for nid, n in wf.items()
-                 if n.get("class_type") == DETAILER_NODE_CLASS), None
-            )
-            branch = next(
-                (n for n in wf.values()
-                 if n.get("class_type") == BRANCH_NODE_CLASS), None
-            )
-            if branch and detailer_nid and upscale_nid:
-                if detailer == "None":
-                    branch["inputs"]["cond"] = False
-                    branch["inputs"]["ff_value"] = [upscale_nid, 0]
-                elif detailer == "Face":
-                    branch["inputs"]["cond"] = False
-                    branch["inputs"]["ff_value"] = [detailer_nid, 0]
-                else:  # Nested
-                    branch["inputs"]["cond"] = True
-                    branch["inputs"]["ff_value"] = [detailer_nid, 0]
+                self._run_on_ui(self.seed_adj.set_value, float(seed))
 
+            # The workflow itself is built by the queue worker; the
+            # job only carries what differs from the template
             job = {
                 "id": str(uuid.uuid4()),
-                "workflow": wf,
+                "base": base,
+                "nodes_by_class": nodes_by_class,
+                "patches": class_patches,
+                "branch": (branch_nid, branch_patch),
+                "seed": seed,
                 "added_at": datetime.datetime.now(),
                 "status": "pending",
-                "row": None,
+                "item": None,
             }
             with self.job_list_lock:
-                self.job_list.append(job)
-            self._add_job_row(job)
+                self.job_list[job["id"]] = job
+                self._pending_jobs.append(job)
+            self._queue_job_row(job)
 
-        self.update_queue_label()
         self.log(
             f"Queued {batch_count} item(s) "
             f"(queue size: {len(self.job_list)})"
@@ -1257,6 +1461,34 @@ class GeneratePage:
                 target=self._process_queue, daemon=True
             ).start()
 
+    def _job_workflow(self, job):
+        """Build the concrete workflow for a queued job."""
+        edits = {}
+        for ct, nids in job["nodes_by_class"].items():
+            patch = job["patches"][ct]
+            if ct == LOADER_NODE_CLASS:
+                patch = {**patch, "seed": job["seed"]}
+            for nid in nids:
+                edits[nid] = patch
+        branch_nid, branch_patch = job["branch"]
+        if branch_patch:
+            edits[branch_nid] = branch_patch
+        return self._clone_workflow_for_job(job["base"], edits)
+
+    @staticmethod
+    def _clone_workflow_for_job(base, edits):
+        """
+        Return a copy of a workflow with per-node input edits applied.
+
+        Only nodes present in edits are copied; the rest are shared with
+        the template, which is never mutated after loading.
+        """
+        wf = dict(base)
+        for nid, patch in edits.items():
+            node = base[nid]
+            wf[nid] = {**node, "inputs": {**node["inputs"], **patch}}
+        return wf
+
     # ------------------------------------------------------------------
     # Queue processing
     # ------------------------------------------------------------------
@@ -1268,7 +1500,9 @@ class GeneratePage:
         while True:
             with self.job_list_lock:
                 job = None
-                for j in self.job_list:
+                while self._pending_jobs:
+                    j = self._pending_jobs.popleft()
+                    # Cancelled jobs stay in the deque; drop them here
                     if j["status"] == "pending":
                         j["status"] = "processing"
                         self.current_job_id = j["id"]
@@ -1281,20 +1515,22 @@ class GeneratePage:
             self.update_queue_label()
             self.log("Processing queued item...")
             try:
-                self._generate_logic(job["workflow"])
+                wf = self._job_workflow(job)
+                self._generate_logic(wf, self._job_exec_order(job, wf))
             except Exception as e:
                 self.log(f"Queue processing error: {e}")
 
             with self.job_list_lock:
-                try:
-                    self.job_list.remove(job)
-                except ValueError:
-                    pass
+                # Flag first so a late cancel click on the row can't stop
+                # whichever job runs next
+                job["status"] = "done"
+                self.job_list.pop(job["id"], None)
                 self.current_job_id = None
             GLib.idle_add(self._remove_job_row_widget, job)
             # Clear stop flag so the next pending job runs normally
             self._stop_requested.clear()
 
+        self._close_worker_ws()
         self.is_processing = False
         GLib.idle_add(self.stop_button.set_sensitive, False)
         self.update_queue_label()
@@ -1302,61 +1538,169 @@ class GeneratePage:
 
     def _topo_sort(self, workflow_data):
         """Return node IDs in topological execution order."""
-        deps = {nid: set() for nid in workflow_data}
-        for nid, node in workflow_data.items():
+        # Work on dense int indices so the traversal doesn't hash node
+        # id strings on every visit
+        node_ids = list(workflow_data)
+        index = {nid: i for i, nid in enumerate(node_ids)}
+        deps = []
+        for node in workflow_data.values():
+            parents = []
             for val in node.get("inputs", {}).values():
                 if isinstance(val, list) and len(val) == 2:
-                    parent = str(val[0])
-                    if parent in workflow_data:
-                        deps[nid].add(parent)
+                    parent = index.get(str(val[0]))
+                    if parent is not None and parent not in parents:
+                        parents.append(parent)
+            deps.append(parents)
 
+        # Iterative post-order DFS; each stack entry holds a node and
+        # the position of the next parent to visit
         order = []
-        visited = set()
-
-        def visit(nid):
-            if nid in visited:
-                return
-            visited.add(nid)
-            for parent in deps.get(nid, []):
-                visit(parent)
-            order.append(nid)
+        visited = bytearray(len(node_ids))
+        for root in range(len(node_ids)):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            stack = [[root, 0]]
+            while stack:
+                top = stack[-1]
+                parents = deps[top[0]]
+                while top[1] < len(parents) and visited[parents[top[1]]]:
+                    top[1] += 1
+                if top[1] < len(parents):
+                    parent = parents[top[1]]
+                    visited[parent] = 1
+                    stack.append([parent, 0])
+                else:
+                    stack.pop()
+                    order.append(node_ids[top[0]])
+        return order
 
-        for nid in workflow_data:
-            visit(nid)
+    def _job_exec_order(self, job, workflow_data):
+        """
+        Return the execution order for a job's workflow.
+
+        Jobs queued by one click share their template and patches, and
+        so their node links, so the last order is reused while the
+        patches object is the same.
+        """
+        cached = self._topo_cache
+        if cached is not None and cached[0] is job["patches"]:
+            return cached[1]
+        order = self._topo_sort(workflow_data)
+        self._topo_cache = (job["patches"], order)
         return order
 
-    def _generate_logic(self, workflow_data):
-        """Execute a single generation request over WebSocket."""
-        start_time = datetime.datetime.now()
+    def _connect_worker_ws(self):
+        """
+        Return the queue worker's websocket, connecting if needed.
+
+        One connection is kept open across jobs so each generation
+        doesn't pay for a new upgrade handshake.
+        """
+        with self._active_ws_lock:
+            ws = self._active_ws
+        if ws is not None and ws.connected:
+            if self._ws_alive(ws):
+                return ws
+            # Dropped while idle; reconnect before /prompt is posted so
+            # the job's progress and output aren't lost with the socket
+            self._close_worker_ws()
         ws = websocket.WebSocket()
         with self._active_ws_lock:
             self._active_ws = ws
+        ws.connect(
+            f"ws://{config.server_address()}"
+            f"/ws?clientId={CLIENT_ID}"
+        )
+        return ws
+
+    @staticmethod
+    def _ws_alive(ws):
+        """
+        Return True if a kept-open websocket still reaches the server.
+
+        ``connected`` stays True after the server restarts or closes an
+        idle socket, until a send or recv fails. Check for a pending
+        close from the server, then ping to make sure the socket can
+        still be written.
+        """
+        try:
+            readable, _, _ = select.select([ws.sock], [], [], 0)
+            if readable:
+                # Queued status messages make the socket readable too;
+                # only EOF or a close frame at the head of the buffer
+                # means the server has ended the connection. A clean
+                # shutdown sends the close frame before the FIN.
+                head = ws.sock.recv(1, socket.MSG_PEEK)
+                if (not head or head[0] & 0x0F
+                        == websocket.ABNF.OPCODE_CLOSE):
+                    return False
+            ws.ping()
+        except Exception:
+            return False
+        return True
+
+    def _close_worker_ws(self):
+        """Close and forget the queue worker's websocket."""
+        with self._active_ws_lock:
+            ws = self._active_ws
+            self._active_ws = None
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+
+    def _history_save_image(self, prompt_id, workflow_data):
+        """Return the save node's first image params from /history."""
+        with self._http.get(
+            f"http://{config.server_address()}/history/{prompt_id}",
+            timeout=10
+        ) as hist_resp:
+            history = hist_resp.json().get(prompt_id, {})
+        for node_id, node_output in history.get("outputs", {}).items():
+            if workflow_data.get(node_id, {}).get(
+                "class_type"
+            ) == SAVE_NODE_CLASS:
+                return node_output["images"][0]
+        return None
+
+    def _generate_logic(self, workflow_data, exec_order=None):
+        """Execute a single generation request over WebSocket."""
+        start_time = datetime.datetime.now()
         try:
-            exec_order = self._topo_sort(workflow_data)
+            if exec_order is None:
+                exec_order = self._topo_sort(workflow_data)
             node_index = {nid: i for i, nid in enumerate(exec_order)}
             total_nodes = len(exec_order)
             current_index = 0
 
-            ws.connect(
-                f"ws://{config.server_address()}"
-                f"/ws?clientId={CLIENT_ID}"
-            )
+            ws = self._connect_worker_ws()
             payload = {"prompt": workflow_data, "client_id": CLIENT_ID}
-            resp = requests.post(
+            with self._http.post(
                 f"http://{config.server_address()}/prompt",
                 json=payload,
                 timeout=10
-            )
-            prompt_id = resp.json().get("prompt_id")
-            resp.close()
+            ) as resp:
+                prompt_id = resp.json().get("prompt_id")
+
+            # Image params of the save node's output, taken from its
+            # "executed" message
+            save_img = None
 
             while True:
-                out = ws.recv()
-                if isinstance(out, bytes):
-                    GLib.idle_add(self._on_image_update, out[8:])
+                # recv_data() hands back the raw payload, so status
+                # messages go to the JSON parser without a utf-8 decode
+                opcode, out = ws.recv_data()
+                if opcode == websocket.ABNF.OPCODE_BINARY:
+                    self._schedule_progress(preview=out[8:])
                     continue
+                if opcode != websocket.ABNF.OPCODE_TEXT:
+                    raise websocket.WebSocketConnectionClosedException(
+                        "Websocket closed by server"
+                    )
 
-                msg = json.loads(out)
+                msg = _json_loads(out)
 
                 if msg["type"] == "executing":
                     node_id = msg["data"]["node"]
@@ -1364,7 +1708,7 @@ class GeneratePage:
                     # Only break on completion of *our* prompt; stale
                     # signals from a previously cancelled job that the
                     # server finally finished would otherwise terminate
-                    # the loop prematurely and skip the history fetch.
+                    # the loop prematurely and skip the final image.
                     if node_id is None and msg_pid == prompt_id:
                         break
                     # Skip progress/label updates for other prompts
@@ -1376,10 +1720,9 @@ class GeneratePage:
                     node_class = workflow_data.get(
                         node_id, {}
                     ).get("class_type", "Unknown")
-                    GLib.idle_add(self.set_current_node, node_class)
-                    GLib.idle_add(
-                        self.progress_bar.set_fraction,
-                        current_index / total_nodes
+                    self._schedule_progress(
+                        fraction=current_index / total_nodes,
+                        node=node_class
                     )
 
                 elif msg["type"] == "progress":
@@ -1390,102 +1733,114 @@ class GeneratePage:
                         current_index / total_nodes
                         + node_progress / total_nodes
                     )
-                    GLib.idle_add(
-                        self.progress_bar.set_fraction, overall
-                    )
+                    self._schedule_progress(fraction=overall)
 
                 elif msg["type"] == "executed":
-                    GLib.idle_add(
-                        self.progress_bar.set_fraction,
-                        (current_index + 1) / total_nodes
+                    self._schedule_progress(
+                        fraction=(current_index + 1) / total_nodes
                     )
-                    if "images" in msg["data"]["output"]:
-                        img = msg["data"]["output"]["images"][0]
-                        img_resp = requests.get(
-                            f"http://{config.server_address()}/view",
-                            params=img
-                        )
-                        GLib.idle_add(
-                            self._on_image_update, img_resp.content
-                        )
-                        img_resp.close()
-
-            hist_resp = requests.get(
-                f"http://{config.server_address()}/history/{prompt_id}",
-                timeout=10
-            )
-            history = hist_resp.json().get(prompt_id, {})
-            hist_resp.close()
-
-            for node_id, node_output in history.get("outputs", {}).items():
-                if workflow_data.get(node_id, {}).get(
-                    "class_type"
-                ) == SAVE_NODE_CLASS:
-                    img = node_output["images"][0]
-                    data_resp = requests.get(
+                    data = msg["data"]
+                    if "images" not in data["output"]:
+                        continue
+                    img = data["output"]["images"][0]
+                    if (
+                        save_img is None
+                        and data.get("prompt_id") in (prompt_id, None)
+                        and workflow_data.get(data.get("node"), {}).get(
+                            "class_type"
+                        ) == SAVE_NODE_CLASS
+                    ):
+                        # Downloaded once below as the final image
+                        save_img = img
+                        continue
+                    with self._http.get(
                         f"http://{config.server_address()}/view",
                         params=img
+                    ) as img_resp:
+                        self._schedule_progress(preview=img_resp.content)
+
+            if save_img is None:
+                # A save node served from the server's cache sends no
+                # "executed" message, so look its output up instead
+                save_img = self._history_save_image(
+                    prompt_id, workflow_data
+                )
+
+            if save_img is not None:
+                img = save_img
+                # Calculate generation time in seconds
+                end_time = datetime.datetime.now()
+                gen_time = (end_time - start_time).total_seconds()
+                img["generation_time"] = gen_time
+                # Stream straight into the image cache rather than
+                # holding the whole body in memory
+                with self._http.get(
+                    f"http://{config.server_address()}/view",
+                    params=img, stream=True
+                ) as data_resp:
+                    data_resp.raise_for_status()
+                    data_resp.raw.decode_content = True
+                    cache_path = image_cache.save_stream(
+                        data_resp.raw, img
                     )
-                    data = data_resp.content
-                    data_resp.close()
-                    # Calculate generation time in seconds
-                    end_time = datetime.datetime.now()
-                    gen_time = (end_time - start_time).total_seconds()
-                    img["generation_time"] = gen_time
-                    GLib.idle_add(self._on_image_final, data, img)
-                    break
+                GLib.idle_add(self._on_image_final, cache_path, img)
 
         except Exception as e:
             # A closed socket raises an error when stop is requested;
             # only log genuine errors.
             if not self._stop_requested.is_set():
                 self.log(f"Gen error: {e}")
+            # The socket may be closed or mid-message; reconnect for
+            # the next job
+            self._close_worker_ws()
         finally:
-            with self._active_ws_lock:
-                self._active_ws = None
-            try:
-                ws.close()
-            except Exception:
-                pass
-            GLib.idle_add(self.progress_bar.set_fraction, 0.0)
-            GLib.idle_add(self.set_current_node, None)
+            self._schedule_progress(fraction=0.0, node=None)
 
     # ------------------------------------------------------------------
     # Text view helpers
     # ------------------------------------------------------------------
 
-    def _on_textview_changed(self, textview):
-        """Debounce handler for tag auto-completion."""
-        if not hasattr(textview, "completion_debounce_id"):
-            textview.completion_debounce_id = None
-
-        if textview.completion_debounce_id:
-            GLib.source_remove(textview.completion_debounce_id)
-            try:
-                self.debounce_timers.remove(
-                    textview.completion_debounce_id
-                )
-            except ValueError:
-                pass
-            textview.completion_debounce_id = None
+    @staticmethod
+    def _on_prompt_focus(scrolled, focused, _ctrl):
+        if focused:
+            scrolled.add_css_class("prompt-focused")
+        else:
+            scrolled.remove_css_class("prompt-focused")
 
-        timer_id = GLib.timeout_add(
-            150,
-            lambda: self._show_completion_if_needed(textview)
-        )
-        textview.completion_debounce_id = timer_id
-        self.debounce_timers.append(timer_id)
+    def _on_textview_changed(self, textview, _buffer):
+        """Debounce handler for tag auto-completion."""
+        # Push the deadline back rather than replacing the timer on
+        # every keystroke; one timer stays armed until typing pauses.
+        textview.completion_deadline = (
+            GLib.get_monotonic_time() + COMPLETION_DEBOUNCE_MS * 1000
+        )
+        if textview.completion_debounce_id is None:
+            timer_id = GLib.timeout_add(
+                COMPLETION_DEBOUNCE_MS,
+                self._on_completion_timeout, textview
+            )
+            textview.completion_debounce_id = timer_id
+            self.debounce_timers.add(timer_id)
+
+    def _on_completion_timeout(self, textview):
+        """Run completion once the debounce deadline has passed."""
+        self.debounce_timers.discard(textview.completion_debounce_id)
+        remaining = textview.completion_deadline - GLib.get_monotonic_time()
+        if remaining > 0:
+            # Typing continued; wait out just the rest of the new
+            # deadline so completion still fires COMPLETION_DEBOUNCE_MS
+            # after the last keystroke
+            timer_id = GLib.timeout_add(
+                remaining // 1000 + 1,
+                self._on_completion_timeout, textview
+            )
+            textview.completion_debounce_id = timer_id
+            self.debounce_timers.add(timer_id)
+            return False
+        textview.completion_debounce_id = None
+        return self._show_completion_if_needed(textview)
 
     def _show_completion_if_needed(self, textview):
-        if hasattr(textview, "completion_debounce_id"):
-            try:
-                self.debounce_timers.remove(
-                    textview.completion_debounce_id
-                )
-            except ValueError:
-                pass
-            textview.completion_debounce_id = None
-
         buffer = textview.get_buffer()
         cursor = buffer.get_insert()
         iter_cursor = buffer.get_iter_at_mark(cursor)
@@ -1496,11 +1851,7 @@ class GeneratePage:
             self.tag_completion.close_popup()
             return False
 
-        text = buffer.get_text(
-            buffer.get_start_iter(),
-            buffer.get_end_iter(),
-            False
-        )
+        text = buffer.get_text(*buffer.get_bounds(), False)
         suggestions = self.tag_completion.get_completions(
             text, iter_cursor.get_offset()
         )
@@ -1521,8 +1872,7 @@ class GeneratePage:
             if not selected_text.strip():
                 return
 
-            weight_pattern = r"^\((.+?):(\d+\.?\d*)\)$"
-            match = re.match(weight_pattern, selected_text)
+            match = _WEIGHT_RE.match(selected_text)
             if match:
                 content = match.group(1)
                 new_weight = float(match.group(2)) + (
@@ -1553,30 +1903,35 @@ class GeneratePage:
         # No selection — operate on tag under cursor
         cursor = buffer.get_insert()
         iter_cursor = buffer.get_iter_at_mark(cursor)
-        iter_start = iter_cursor.copy()
-        iter_end = iter_cursor.copy()
-
-        leading_space = ""
-        while not iter_start.starts_line():
-            iter_start.backward_char()
-            if iter_start.get_char() == ",":
-                iter_start.forward_char()
-                while iter_start.get_char() == " ":
-                    leading_space += " "
-                    iter_start.forward_char()
-                break
-
-        while not iter_end.ends_line():
-            if iter_end.get_char() == ",":
-                break
-            iter_end.forward_char()
-
-        tag_text = buffer.get_text(iter_start, iter_end, False).strip()
+        line_start = iter_cursor.copy()
+        line_start.set_line_offset(0)
+        line_end = iter_cursor.copy()
+        if not line_end.ends_line():
+            line_end.forward_to_line_end()
+
+        # The tag runs from just after the previous comma on this line
+        # to the next one; let GTK scan for them rather than stepping
+        # through the buffer a character at a time
+        prev_comma = iter_cursor.backward_search(
+            ",", Gtk.TextSearchFlags.TEXT_ONLY, line_start
+        )
+        next_comma = iter_cursor.forward_search(
+            ",", Gtk.TextSearchFlags.TEXT_ONLY, line_end
+        )
+        iter_start_with_space = prev_comma[1] if prev_comma else line_start
+        iter_end = next_comma[0] if next_comma else line_end
+
+        segment = buffer.get_text(iter_start_with_space, iter_end, False)
+        tag_text = segment.strip()
         if not tag_text:
             return
+        # Keep the spacing that followed the comma
+        leading_space = (
+            segment[:len(segment) - len(segment.lstrip(" "))]
+            if prev_comma else ""
+        )
 
-        weight_pattern = r"^\((.+?):(\d+\.?\d*)\)$"
-        match = re.match(weight_pattern, tag_text)
+        match = _WEIGHT_RE.match(tag_text)
         if match:
             tag_content = match.group(1)
             new_weight = float(match.group(2)) + (
@@ -1594,18 +1949,12 @@ class GeneratePage:
                 else f"({tag_text}:{new_weight:.1f})"
             )
 
-        # Rewind to include leading space
-        iter_start_with_space = iter_cursor.copy()
-        while not iter_start_with_space.starts_line():
-            iter_start_with_space.backward_char()
-            if iter_start_with_space.get_char() == ",":
-                iter_start_with_space.forward_char()
-                break
-
         buffer.delete(iter_start_with_space, iter_end)
         buffer.insert(iter_start_with_space, leading_space + new_tag)
 
-    def _on_textview_key_press(self, textview, keyval, keycode, state):
+    def _on_textview_key_press(
+        self, textview, _ctrl, keyval, keycode, state
+    ):
         ctrl = state & Gdk.ModifierType.CONTROL_MASK
         alt = state & Gdk.ModifierType.ALT_MASK
 
@@ -1,64 +1,67 @@
 #!/usr/bin/python3
 """LoRAs page: browsable grid of LoRA cards from ComfyUI-Lora-Manager."""
+import re
 import threading
-import weakref
-import requests
 import gi
 import config
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-gi.require_version('GdkPixbuf', '2.0')
 
-from gi.repository import Gtk, Adw, GLib, Gdk, Pango, GdkPixbuf  # noqa
-from widgets import crud_dialog  # noqa
+from gi.repository import (  # noqa
+    Gtk, Adw, GLib, Gdk, Gio, GObject, Pango
+)
+from widgets import crud_dialog, lm_browser, preview_loader  # noqa
 
 # Card thumbnail dimensions
-THUMB_SIZE = 200
+THUMB_SIZE = preview_loader.THUMB_SIZE
 # Number of loras per API page
 PAGE_SIZE = 48
-# Module-level preview cache: URL -> scaled GdkPixbuf at THUMB_SIZE.
-# Persists across reloads; only the small version is kept in memory.
-_preview_cache: dict = {}
-_preview_cache_lock = threading.Lock()
-
-
-def _pixbuf_to_texture(pixbuf):
-    """Convert a GdkPixbuf to a Gdk.MemoryTexture."""
-    has_alpha = pixbuf.get_has_alpha()
-    fmt = (
-        Gdk.MemoryFormat.R8G8B8A8
-        if has_alpha
-        else Gdk.MemoryFormat.R8G8B8
-    )
-    gbytes = GLib.Bytes.new(pixbuf.get_pixels())
-    return Gdk.MemoryTexture.new(
-        pixbuf.get_width(), pixbuf.get_height(),
-        fmt, gbytes, pixbuf.get_rowstride()
-    )
-
-
-class LoraCard(Gtk.Frame):
-    """A card for a single LoRA with thumbnail and name overlay."""
-
-    def __init__(self, lora_data, on_click=None, on_edit=None):
-        super().__init__(css_classes=['card'])
+# Typing pause before a search reloads the grid (GTK default: 150)
+SEARCH_DELAY_MS = 400
+# CivitAI URL parts: ?modelVersionId=<id> and /models/<id>
+_VERSION_ID_RE = re.compile(r'modelVersionId=(\d+)', re.IGNORECASE)
+_MODEL_ID_RE = re.compile(r'/models/(\d+)')
+# Set once the page's CSS provider is on the display
+_css_installed = False
+
+
+class LoraItem(GObject.Object):
+    """List store entry wrapping one LoRA's API data."""
+
+    def __init__(self, lora_data, preview_url):
+        super().__init__()
         self.lora_data = lora_data
+        # Absolute preview URL, resolved once per page
+        self.preview_url = preview_url
+
+
+class LoraCard(preview_loader.PreviewCard):
+    """
+    A card with thumbnail and name overlay. Cards are recycled by the
+    grid view, so one card shows whichever LoRA it was last bound to.
+    """
+
+    def __init__(self, on_click=None, on_edit=None, on_deleted=None):
+        super().__init__(css_classes=['card'])
+        self.lora_data = None
         self.on_click = on_click
         self.on_edit = on_edit
+        self.on_deleted = on_deleted
 
         self.set_size_request(THUMB_SIZE, THUMB_SIZE)
 
         overlay = Gtk.Overlay()
         self.set_child(overlay)
 
-        # Thumbnail picture
-        self.picture = Gtk.Picture(
-            content_fit=Gtk.ContentFit.COVER,
-            can_shrink=True
-        )
-        self.picture.set_size_request(THUMB_SIZE, THUMB_SIZE)
-        overlay.set_child(self.picture)
+        # Only the overlay's main child is measured, so a fixed-size
+        # spacer sets the card size and a wide preview can't stretch it
+        sizer = Gtk.Box()
+        sizer.set_size_request(THUMB_SIZE, THUMB_SIZE)
+        overlay.set_child(sizer)
+
+        # Thumbnail picture, set up by PreviewCard
+        overlay.add_overlay(self.picture)
 
         # Name / base model overlay at the bottom.
         # halign=FILL clamps the box to card width so labels can
@@ -70,24 +73,22 @@ class LoraCard(Gtk.Frame):
         info_box.set_halign(Gtk.Align.FILL)
         info_box.add_css_class('lora-card-info')
 
-        name_label = Gtk.Label(label=lora_data.get('model_name', ''))
-        name_label.add_css_class('lora-card-name')
-        name_label.set_halign(Gtk.Align.START)
-        name_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._name_label = Gtk.Label()
+        self._name_label.add_css_class('lora-card-name')
+        self._name_label.set_halign(Gtk.Align.START)
+        self._name_label.set_ellipsize(Pango.EllipsizeMode.END)
         # width_chars=1 collapses the label's natural width so it
-        # doesn't inflate the card's natural size for FlowBox layout.
-        name_label.set_width_chars(1)
-        info_box.append(name_label)
-
-        base_model = lora_data.get('base_model', '').strip()
-        if base_model:
-            base_label = Gtk.Label(label=base_model)
-            base_label.add_css_class('caption')
-            base_label.add_css_class('lora-base-label')
-            base_label.set_halign(Gtk.Align.START)
-            base_label.set_ellipsize(Pango.EllipsizeMode.END)
-            base_label.set_width_chars(1)
-            info_box.append(base_label)
+        # doesn't inflate the card's natural size for grid layout.
+        self._name_label.set_width_chars(1)
+        info_box.append(self._name_label)
+
+        self._base_label = Gtk.Label()
+        self._base_label.add_css_class('caption')
+        self._base_label.add_css_class('lora-base-label')
+        self._base_label.set_halign(Gtk.Align.START)
+        self._base_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._base_label.set_width_chars(1)
+        info_box.append(self._base_label)
 
         overlay.add_overlay(info_box)
 
@@ -101,96 +102,43 @@ class LoraCard(Gtk.Frame):
         rclick.connect('released', self._on_right_click)
         self.add_controller(rclick)
 
-        # Load preview image in the background.
-        # Use a weakref so the thread doesn't keep removed cards alive.
-        preview_url = lora_data.get('preview_url', '')
-        if preview_url:
-            threading.Thread(
-                target=self._load_preview,
-                args=(weakref.ref(self), preview_url),
-                daemon=True
-            ).start()
-
-    @staticmethod
-    def _load_preview(weak_self, url):
-        """Fetch, scale, and cache preview; update card if still alive."""
-        # Resolve relative URLs
-        if url.startswith('/'):
-            url = f"http://{config.server_address()}{url}"
-
-        # Check module-level cache for an already-scaled pixbuf
-        with _preview_cache_lock:
-            pixbuf = _preview_cache.get(url)
-
-        if pixbuf is None:
-            try:
-                resp = requests.get(url, timeout=10)
-                if resp.status_code != 200:
-                    return
-                loader = GdkPixbuf.PixbufLoader.new()
-                loader.write(resp.content)
-                loader.close()
-                full = loader.get_pixbuf()
-            except Exception:
-                return  # Missing previews are fine
-
-            if not full:
-                return
-
-            # Scale to a square THUMB_SIZE crop (cover fit) so only
-            # the small version is ever held in memory.
-            src_w = full.get_width()
-            src_h = full.get_height()
-            scale = max(THUMB_SIZE / src_w, THUMB_SIZE / src_h)
-            scaled_w = max(1, int(src_w * scale))
-            scaled_h = max(1, int(src_h * scale))
-            pixbuf = full.scale_simple(
-                scaled_w, scaled_h,
-                GdkPixbuf.InterpType.BILINEAR
-            )
-            # Let the full-size pixbuf go out of scope immediately
-            del full
-
-            with _preview_cache_lock:
-                _preview_cache[url] = pixbuf
-
-        if not pixbuf:
-            return
-
-        # Only schedule the UI update if the card is still alive
-        def apply(pb=pixbuf, wr=weak_self):
-            card = wr()
-            if card is not None:
-                card._set_texture(pb)
-
-        GLib.idle_add(apply)
-
-    def _set_texture(self, pixbuf):
-        self.picture.set_paintable(_pixbuf_to_texture(pixbuf))
+    def bind(self, lora_data, preview_url):
+        """Show *lora_data* on this card and start its preview load."""
+        self.lora_data = lora_data
+        self._name_label.set_label(lora_data.get('model_name', ''))
+        base_model = lora_data.get('base_model', '').strip()
+        self._base_label.set_label(base_model)
+        self._base_label.set_visible(bool(base_model))
+        self.bind_preview(lora_data, preview_url)
 
-    def do_measure(self, orientation, for_size):
-        """Cap natural size to THUMB_SIZE so FlowBox lays out correctly."""
-        return THUMB_SIZE, THUMB_SIZE, -1, -1
+    def unbind(self):
+        """Detach the card from its LoRA and drop any queued fetch."""
+        self.lora_data = None
+        self.unbind_preview()
+        crud_dialog.clear_card_context_menu(self)
 
     def _on_click(self, gesture, n_press, x, y):
-        if self.on_click:
+        if self.on_click and self.lora_data is not None:
             self.on_click(self.lora_data)
 
     def _on_right_click(self, gesture, n_press, x, y):
         """Show a context menu with Edit and Delete actions."""
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
+        if self.lora_data is None:
+            return
+        lora_data = self.lora_data
         crud_dialog.show_card_context_menu(
             self, x, y,
             on_edit=(
-                (lambda: self.on_edit(self.lora_data))
+                (lambda: self.on_edit(lora_data))
                 if self.on_edit else None
             ),
-            on_delete=self._confirm_delete
+            on_delete=lambda: self._confirm_delete(lora_data)
         )
 
-    def _confirm_delete(self):
+    def _confirm_delete(self, lora_data):
         """Show a confirmation dialog before deleting."""
-        name = self.lora_data.get('model_name', 'this LoRA')
+        name = lora_data.get('model_name', 'this LoRA')
         dialog = Adw.AlertDialog(
             heading='Delete LoRA?',
             body=f'\u201c{name}\u201d will be permanently deleted from disk.'
@@ -202,35 +150,35 @@ class LoraCard(Gtk.Frame):
         )
         dialog.set_default_response('cancel')
         dialog.set_close_response('cancel')
-        dialog.connect('response', self._on_delete_response)
+        dialog.connect('response', self._on_delete_response, lora_data)
         dialog.present(self.get_root())
 
-    def _on_delete_response(self, dialog, response):
+    def _on_delete_response(self, dialog, response, lora_data):
         """Fire off the delete request if confirmed."""
         if response != 'delete':
             return
-        file_path = self.lora_data.get('file_path', '')
-        if not file_path:
+        if not lora_data.get('file_path', ''):
             return
         threading.Thread(
             target=self._delete_worker,
-            args=(file_path,),
+            args=(lora_data,),
             daemon=True
         ).start()
 
-    def _delete_worker(self, file_path):
+    def _delete_worker(self, lora_data):
         """POST delete request to Lora Manager."""
         try:
             url = (
                 f"http://{config.server_address()}"
                 f"/api/lm/loras/delete"
             )
-            resp = requests.post(
-                url, json={'file_path': file_path}, timeout=10
+            resp = lm_browser.SESSION.post(
+                url, json={'file_path': lora_data['file_path']}, timeout=10
             )
             if resp.status_code == 200:
-                # Remove the card from the FlowBox on the main thread
-                GLib.idle_add(self._remove_self)
+                # Drop the LoRA from the grid on the main thread
+                if self.on_deleted:
+                    GLib.idle_add(self.on_deleted, lora_data)
             else:
                 print(
                     f"[loras] delete error {resp.status_code}: "
@@ -239,19 +187,11 @@ class LoraCard(Gtk.Frame):
         except Exception as e:
             print(f"[loras] delete exception: {e}")
 
-    def _remove_self(self):
-        """Remove this card from its FlowBox parent."""
-        parent = self.get_parent()
-        if parent:
-            flow = parent.get_parent()
-            if flow:
-                flow.remove(parent)
-
 
 class LorasPage:
     """
     LoRA browser tab — fetches pages from ComfyUI-Lora-Manager and
-    displays them in a scrollable FlowBox grid.
+    displays them in a scrollable grid view.
 
     Callbacks
     ---------
@@ -267,15 +207,24 @@ class LorasPage:
         self._current_page = 1
         self._total_pages = 1
         self._loading = False
+        # True while a scroll position check is queued
+        self._scroll_pending = False
         self._search_text = ''
         # Sort direction: True = descending
         self._sort_desc = True
         # Active sidebar filters (sets for multi-select)
         self._active_base_models = set()
         self._active_tags = set()
+        # Repeated base_model / tag_include query params for the active
+        # filters, rebuilt only when the selection changes
+        self._filter_params = ()
+        # Earlier list responses, revalidated by ETag
+        self._list_cache = lm_browser.ListCache()
 
         self._build_ui()
-        GLib.idle_add(self._fetch_page, 1)
+        # Start the first request now so it overlaps the window's
+        # first paint instead of waiting for an idle turn
+        self._fetch_page(1)
 
     # ------------------------------------------------------------------
     # UI construction
@@ -313,6 +262,7 @@ class LorasPage:
 
         self._search = Gtk.SearchEntry(
             placeholder_text='Search LoRAs…',
+            search_delay=SEARCH_DELAY_MS,
             hexpand=True
         )
         self._search.connect('search-changed', self._on_search_changed)
@@ -320,7 +270,7 @@ class LorasPage:
 
         # Sort dropdown
         self._sort_labels = {'name': 'Name', 'date': 'Newest', 'size': 'Size'}
-        self._sort_keys = ['name', 'date', 'size']
+        self._sort_keys = list(self._sort_labels)
         sort_display = Gtk.StringList.new(
             [self._sort_labels[k] for k in self._sort_keys]
         )
@@ -384,7 +334,14 @@ class LorasPage:
         # )
         # content_box.append(self._sidebar_sep)
 
-        # Scrolled window containing the flow grid
+        # Grid column: the scrolled grid with the loading spinner below
+        grid_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            hexpand=True,
+            vexpand=True
+        )
+
+        # Scrolled window containing the grid view
         scroll = Gtk.ScrolledWindow(
             hscrollbar_policy=Gtk.PolicyType.NEVER,
             vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
@@ -396,32 +353,32 @@ class LorasPage:
         vadj = scroll.get_vadjustment()
         vadj.connect('value-changed', self._on_scroll_changed)
 
-        inner = Gtk.Box(
-            orientation=Gtk.Orientation.VERTICAL,
-            margin_start=16,
-            margin_end=16,
-            margin_bottom=16,
-            hexpand=True
-        )
-
-        self._flow = Gtk.FlowBox(
-            max_children_per_line=12,
-            min_children_per_line=1,
-            row_spacing=12,
-            column_spacing=12,
-            selection_mode=Gtk.SelectionMode.NONE,
-            valign=Gtk.Align.START,
+        # Only the cards in view are realized; the factory rebinds
+        # them as the grid scrolls
+        self._store = Gio.ListStore.new(LoraItem)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_card_setup)
+        factory.connect('bind', self._on_card_bind)
+        factory.connect('unbind', self._on_card_unbind)
+        self._grid = Gtk.GridView(
+            model=Gtk.NoSelection.new(self._store),
+            factory=factory,
+            max_columns=12,
+            min_columns=1,
+            css_classes=['lora-grid'],
             hexpand=True
         )
-        inner.append(self._flow)
+        scroll.set_child(self._grid)
+        grid_box.append(scroll)
 
         # Spinner shown while loading
         self._spinner = Gtk.Spinner(
             margin_top=16,
             margin_bottom=16,
-            halign=Gtk.Align.CENTER
+            halign=Gtk.Align.CENTER,
+            visible=False
         )
-        inner.append(self._spinner)
+        grid_box.append(self._spinner)
 
         # Status / empty state
         self._status = Adw.StatusPage(
@@ -435,8 +392,7 @@ class LorasPage:
         self._status.set_visible(False)
         content_box.append(self._status)
 
-        scroll.set_child(inner)
-        content_box.append(scroll)
+        content_box.append(grid_box)
         self._scroll_adj = vadj
         self._setup_css()
 
@@ -484,6 +440,10 @@ class LorasPage:
         self._base_model_list.connect(
             'selected-rows-changed', self._on_base_model_changed
         )
+        self._base_model_store = Gio.ListStore.new(lm_browser.FilterItem)
+        self._base_model_list.bind_model(
+            self._base_model_store, self._create_filter_row
+        )
         self._add_toggle_gesture(self._base_model_list)
         sidebar.append(self._base_model_list)
 
@@ -503,18 +463,24 @@ class LorasPage:
         self._tag_list.connect(
             'selected-rows-changed', self._on_tag_changed
         )
+        self._tag_store = Gio.ListStore.new(lm_browser.FilterItem)
+        self._tag_list.bind_model(
+            self._tag_store, self._create_filter_row
+        )
         self._add_toggle_gesture(self._tag_list)
         sidebar.append(self._tag_list)
 
         sidebar_scroll.set_child(sidebar)
 
-        # Fetch sidebar data in the background
-        threading.Thread(
-            target=self._fetch_sidebar_data, daemon=True
-        ).start()
+        lm_browser.load_filters(
+            'loras', self._base_model_store, self._tag_store, self.log_fn
+        )
 
         return sidebar_scroll
 
+    def _create_filter_row(self, item):
+        return self._make_filter_row(item.value, item.count)
+
     def _make_filter_row(self, label, count):
         """Create a ListBoxRow with a label and count badge."""
         row = Gtk.ListBoxRow()
@@ -545,6 +511,11 @@ class LorasPage:
         return row
 
     def _setup_css(self):
+        """Install the page's CSS once per process."""
+        global _css_installed
+        if _css_installed:
+            return
+        _css_installed = True
         css_provider = Gtk.CssProvider()
         css = b"""
             .lora-card-info {
@@ -565,6 +536,14 @@ class LorasPage:
                 opacity: 0.75;
                 font-size: 0.75em;
             }
+            .lora-grid {
+                background: none;
+                padding: 0 10px 10px;
+            }
+            .lora-grid > child {
+                background: none;
+                padding: 6px;
+            }
         """
         css_provider.load_from_data(css)
         Gtk.StyleContext.add_provider_for_display(
@@ -592,84 +571,39 @@ class LorasPage:
         if self._loading:
             return
         self._loading = True
+        self._spinner.set_visible(True)
         self._spinner.start()
         threading.Thread(
             target=self._fetch_worker,
-            args=(page, self._search_text, self._sort_key()),
+            args=(
+                page, self._search_text, self._sort_key(),
+                self._filter_params
+            ),
             daemon=True
         ).start()
 
-    def _fetch_sidebar_data(self):
-        """Fetch base models and tags to populate the sidebar."""
-        base = config.server_address()
-        try:
-            r = requests.get(
-                f"http://{base}/api/lm/loras/base-models", timeout=10
-            )
-            if r.status_code == 200:
-                items = r.json().get('base_models', [])
-                GLib.idle_add(self._populate_base_models, items)
-        except Exception as e:
-            self.log_fn(f"[loras] sidebar base-models error: {e}")
-        try:
-            r = requests.get(
-                f"http://{base}/api/lm/loras/top-tags", timeout=10
-            )
-            if r.status_code == 200:
-                items = r.json().get('tags', [])
-                GLib.idle_add(self._populate_tags, items)
-        except Exception as e:
-            self.log_fn(f"[loras] sidebar tags error: {e}")
-
-    def _populate_base_models(self, items):
-        """Add base model rows to the sidebar list."""
-        for item in items:
-            row = self._make_filter_row(
-                item['name'], item['count']
-            )
-            self._base_model_list.append(row)
-
-    def _populate_tags(self, items):
-        """Add tag rows to the sidebar list."""
-        for item in items:
-            row = self._make_filter_row(
-                item['tag'], item['count']
-            )
-            self._tag_list.append(row)
-
-    def _fetch_worker(self, page, search, sort_by):
+    def _fetch_worker(self, page, search, sort_by, filter_params):
         """Worker thread: call the Lora Manager API and schedule update."""
         try:
-            params = {
-                'page': page,
-                'page_size': PAGE_SIZE,
-                'sort_by': sort_by,
-            }
+            params = [
+                ('page', page),
+                ('page_size', PAGE_SIZE),
+                ('sort_by', sort_by),
+            ]
             if search:
-                params['search'] = search
-            # Pass multiple base_model / tag_include params
-            for bm in self._active_base_models:
-                params.setdefault('base_model', [])
-                if isinstance(params['base_model'], list):
-                    params['base_model'].append(bm)
-            for tag in self._active_tags:
-                params.setdefault('tag_include', [])
-                if isinstance(params['tag_include'], list):
-                    params['tag_include'].append(tag)
+                params.append(('search', search))
+            params.extend(filter_params)
             url = (
                 f"http://{config.server_address()}"
                 f"/api/lm/loras/list"
             )
-            resp = requests.get(url, params=params, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
+            status, data = self._list_cache.get(url, params)
+            if data is not None:
                 GLib.idle_add(
                     self._on_page_received, data, page == 1
                 )
             else:
-                self.log_fn(
-                    f"[loras] API error {resp.status_code}"
-                )
+                self.log_fn(f"[loras] API error {status}")
                 GLib.idle_add(self._on_fetch_done, True)
         except Exception as e:
             self.log_fn(f"[loras] fetch error: {e}")
@@ -684,35 +618,35 @@ class LorasPage:
         if clear_first:
             self._clear_grid()
 
+        # Resolve relative preview URLs once for the whole page so
+        # both forms share a cache entry
+        base = f"http://{config.server_address()}"
+        new_items = []
         for lora in items:
-            card = LoraCard(
-                lora,
-                on_click=self._on_card_clicked,
-                on_edit=self._on_edit_lora
-            )
-            self._flow.append(card)
+            url = lora.get('preview_url', '')
+            if url.startswith('/'):
+                url = base + url
+            new_items.append(LoraItem(lora, url))
+        self._store.splice(self._store.get_n_items(), 0, new_items)
 
         # Show empty state only on first page with no results
         empty = (clear_first and len(items) == 0)
         self._status.set_visible(empty)
-        self._flow.set_visible(not empty)
+        self._grid.set_visible(not empty)
         self._on_fetch_done(False)
 
     def _on_fetch_done(self, error=False):
         """Reset loading state and stop spinner."""
         self._loading = False
         self._spinner.stop()
+        self._spinner.set_visible(False)
         if not error:
             # If the content doesn't fill the viewport yet, keep loading
             GLib.idle_add(self._load_until_full)
 
     def _clear_grid(self):
-        """Remove all children from the flow box."""
-        child = self._flow.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self._flow.remove(child)
-            child = nxt
+        """Remove all items from the grid's store."""
+        self._store.remove_all()
 
     def _load_until_full(self):
         """Fetch the next page if content doesn't fill the viewport."""
@@ -736,7 +670,15 @@ class LorasPage:
     # ------------------------------------------------------------------
 
     def _on_scroll_changed(self, adj):
+        """Queue one bottom check for however many scroll steps arrive."""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        GLib.idle_add(self._check_scroll_position, adj)
+
+    def _check_scroll_position(self, adj):
         """Load the next page when scrolled close to the bottom."""
+        self._scroll_pending = False
         if self._loading:
             return
         if self._current_page >= self._total_pages:
@@ -809,6 +751,7 @@ class LorasPage:
         self._tag_list.handler_unblock_by_func(self._on_tag_changed)
         self._active_base_models.clear()
         self._active_tags.clear()
+        self._update_filter_params()
         self._reload()
 
     def _on_base_model_changed(self, listbox):
@@ -817,6 +760,7 @@ class LorasPage:
             row._filter_value
             for row in listbox.get_selected_rows()
         }
+        self._update_filter_params()
         self._reload()
 
     def _on_tag_changed(self, listbox):
@@ -825,8 +769,16 @@ class LorasPage:
             row._filter_value
             for row in listbox.get_selected_rows()
         }
+        self._update_filter_params()
         self._reload()
 
+    def _update_filter_params(self):
+        """Rebuild the list query params for the active filters."""
+        self._filter_params = tuple(
+            [('base_model', bm) for bm in sorted(self._active_base_models)]
+            + [('tag_include', tag) for tag in sorted(self._active_tags)]
+        )
+
     # ------------------------------------------------------------------
     # Install from URL
     # ------------------------------------------------------------------
@@ -875,14 +827,13 @@ class LorasPage:
         Extract model_id and model_version_id from a CivitAI URL.
         Returns (model_id, version_id) as ints or None.
         """
-        import re
         version_id = None
         # modelVersionId in query string takes priority
-        m = re.search(r'modelVersionId=(\d+)', url, re.IGNORECASE)
+        m = _VERSION_ID_RE.search(url)
         if m:
             version_id = int(m.group(1))
         # /models/<id> in path
-        m = re.search(r'/models/(\d+)', url)
+        m = _MODEL_ID_RE.search(url)
         model_id = int(m.group(1)) if m else None
         return model_id, version_id
 
@@ -902,7 +853,7 @@ class LorasPage:
                 f"http://{config.server_address()}"
                 f"/api/lm/download-model"
             )
-            resp = requests.post(api_url, json=payload, timeout=30)
+            resp = lm_browser.SESSION.post(api_url, json=payload, timeout=30)
             if resp.status_code == 200:
                 self.log_fn(f"[loras] download queued: {url}")
                 GLib.idle_add(self._reload)
@@ -915,9 +866,33 @@ class LorasPage:
             self.log_fn(f"[loras] install exception: {e}")
 
     # ------------------------------------------------------------------
-    # Card click / edit
+    # Card factory / click / edit
     # ------------------------------------------------------------------
 
+    def _on_card_setup(self, factory, list_item):
+        """Build a reusable card shell for the grid."""
+        list_item.set_child(LoraCard(
+            on_click=self._on_card_clicked,
+            on_edit=self._on_edit_lora,
+            on_deleted=self._on_lora_deleted
+        ))
+
+    def _on_card_bind(self, factory, list_item):
+        item = list_item.get_item()
+        list_item.get_child().bind(item.lora_data, item.preview_url)
+
+    def _on_card_unbind(self, factory, list_item):
+        # Clearing the store unbinds every card, which cancels the
+        # previews still queued for the old results
+        list_item.get_child().unbind()
+
+    def _on_lora_deleted(self, lora_data):
+        """Remove a deleted LoRA's item from the grid."""
+        for pos, item in enumerate(self._store):
+            if item.lora_data is lora_data:
+                self._store.remove(pos)
+                break
+
     def _on_card_clicked(self, lora_data):
         if self.on_lora_selected:
             self.on_lora_selected(lora_data)
@@ -940,7 +915,7 @@ class LorasPage:
                 f"http://{config.server_address()}"
                 f"/api/lm/loras/metadata"
             )
-            resp = requests.get(
+            resp = lm_browser.SESSION.get(
                 url, params={'file_path': file_path}, timeout=10
             )
             data = resp.json() if resp.status_code == 200 else {}
@@ -968,7 +943,7 @@ class LorasPage:
                     'file_path': file_path,
                     'civitai': {'trainedWords': trained_words}
                 }
-                resp = requests.post(url, json=payload, timeout=10)
+                resp = lm_browser.SESSION.post(url, json=payload, timeout=10)
                 if resp.status_code != 200:
                     self.log_fn(
                         f"[loras] save-metadata error "
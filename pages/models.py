@@ -3,66 +3,69 @@
 Models page: browsable grid of checkpoint model cards from
 ComfyUI-Lora-Manager.
 """
+import re
 import threading
-import weakref
-import requests
 import gi
 import config
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-gi.require_version('GdkPixbuf', '2.0')
 
-from gi.repository import Gtk, Adw, GLib, Gdk, Pango, GdkPixbuf  # noqa
+from gi.repository import (  # noqa
+    Gtk, Adw, GLib, Gdk, Gio, GObject, Pango
+)
+from widgets import lm_browser, preview_loader  # noqa
 
 # Card thumbnail dimensions
-THUMB_SIZE = 200
+THUMB_SIZE = preview_loader.THUMB_SIZE
 # Number of models per API page
 PAGE_SIZE = 48
-# Module-level preview cache: URL -> scaled GdkPixbuf at THUMB_SIZE.
-# Persists across reloads; only the small version is kept in memory.
-_preview_cache: dict = {}
-_preview_cache_lock = threading.Lock()
-
-
-def _pixbuf_to_texture(pixbuf):
-    """Convert a GdkPixbuf to a Gdk.MemoryTexture."""
-    has_alpha = pixbuf.get_has_alpha()
-    fmt = (
-        Gdk.MemoryFormat.R8G8B8A8
-        if has_alpha
-        else Gdk.MemoryFormat.R8G8B8
-    )
-    gbytes = GLib.Bytes.new(pixbuf.get_pixels())
-    return Gdk.MemoryTexture.new(
-        pixbuf.get_width(), pixbuf.get_height(),
-        fmt, gbytes, pixbuf.get_rowstride()
-    )
-
-
-class ModelCard(Gtk.Frame):
+# Typing pause before a search reloads the grid (GTK default: 150)
+SEARCH_DELAY_MS = 400
+# CivitAI URL parts: ?modelVersionId=<id> and /models/<id>
+_VERSION_ID_RE = re.compile(r'modelVersionId=(\d+)', re.IGNORECASE)
+_MODEL_ID_RE = re.compile(r'/models/(\d+)')
+
+
+class ModelItem(GObject.Object):
+    """List store entry wrapping one model's API data."""
+
+    def __init__(self, model_data, preview_url):
+        super().__init__()
+        self.model_data = model_data
+        # Absolute preview URL, resolved once per page
+        self.preview_url = preview_url
+
+
+class ModelCard(preview_loader.PreviewCard):
     """
-    A card for a single checkpoint model with thumbnail and name
-    overlay.
+    A card with thumbnail and name overlay for a checkpoint model.
+    Cards are recycled by the grid view, so one card shows whichever
+    model it was last bound to.
     """
 
-    def __init__(self, model_data, on_click=None):
+    def __init__(self, on_click=None, on_deleted=None):
         super().__init__(css_classes=['card'])
-        self.model_data = model_data
+        self.model_data = None
         self.on_click = on_click
+        self.on_deleted = on_deleted
+        # Right-click menu and the model it was opened for
+        self._context_popover = None
+        self._menu_model_data = None
 
         self.set_size_request(THUMB_SIZE, THUMB_SIZE)
 
         overlay = Gtk.Overlay()
         self.set_child(overlay)
 
-        # Thumbnail picture
-        self.picture = Gtk.Picture(
-            content_fit=Gtk.ContentFit.COVER,
-            can_shrink=True
-        )
-        self.picture.set_size_request(THUMB_SIZE, THUMB_SIZE)
-        overlay.set_child(self.picture)
+        # Only the overlay's main child is measured, so a fixed-size
+        # spacer sets the card size and a wide preview can't stretch it
+        sizer = Gtk.Box()
+        sizer.set_size_request(THUMB_SIZE, THUMB_SIZE)
+        overlay.set_child(sizer)
+
+        # Thumbnail picture, set up by PreviewCard
+        overlay.add_overlay(self.picture)
 
         # Name / base model overlay at the bottom.
         # halign=FILL clamps the box to card width so labels can
@@ -74,24 +77,22 @@ class ModelCard(Gtk.Frame):
         info_box.set_halign(Gtk.Align.FILL)
         info_box.add_css_class('model-card-info')
 
-        name_label = Gtk.Label(label=model_data.get('model_name', ''))
-        name_label.add_css_class('model-card-name')
-        name_label.set_halign(Gtk.Align.START)
-        name_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._name_label = Gtk.Label()
+        self._name_label.add_css_class('model-card-name')
+        self._name_label.set_halign(Gtk.Align.START)
+        self._name_label.set_ellipsize(Pango.EllipsizeMode.END)
         # width_chars=1 collapses the label's natural width so it
-        # doesn't inflate the card's natural size for FlowBox layout.
-        name_label.set_width_chars(1)
-        info_box.append(name_label)
-
-        base_model = model_data.get('base_model', '').strip()
-        if base_model:
-            base_label = Gtk.Label(label=base_model)
-            base_label.add_css_class('caption')
-            base_label.add_css_class('model-base-label')
-            base_label.set_halign(Gtk.Align.START)
-            base_label.set_ellipsize(Pango.EllipsizeMode.END)
-            base_label.set_width_chars(1)
-            info_box.append(base_label)
+        # doesn't inflate the card's natural size for grid layout.
+        self._name_label.set_width_chars(1)
+        info_box.append(self._name_label)
+
+        self._base_label = Gtk.Label()
+        self._base_label.add_css_class('caption')
+        self._base_label.add_css_class('model-base-label')
+        self._base_label.set_halign(Gtk.Align.START)
+        self._base_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._base_label.set_width_chars(1)
+        info_box.append(self._base_label)
 
         overlay.add_overlay(info_box)
 
@@ -105,90 +106,48 @@ class ModelCard(Gtk.Frame):
         rclick.connect('released', self._on_right_click)
         self.add_controller(rclick)
 
-        # Load preview image in the background.
-        # Use a weakref so the thread doesn't keep removed cards alive.
-        preview_url = model_data.get('preview_url', '')
-        if preview_url:
-            threading.Thread(
-                target=self._load_preview,
-                args=(weakref.ref(self), preview_url),
-                daemon=True
-            ).start()
-
-    @staticmethod
-    def _load_preview(weak_self, url):
-        """Fetch, scale, and cache preview; update card if still alive."""
-        # Resolve relative URLs
-        if url.startswith('/'):
-            url = f"http://{config.server_address()}{url}"
-
-        # Check module-level cache for an already-scaled pixbuf
-        with _preview_cache_lock:
-            pixbuf = _preview_cache.get(url)
-
-        if pixbuf is None:
-            try:
-                resp = requests.get(url, timeout=10)
-                if resp.status_code != 200:
-                    return
-                loader = GdkPixbuf.PixbufLoader.new()
-                loader.write(resp.content)
-                loader.close()
-                full = loader.get_pixbuf()
-            except Exception:
-                return  # Missing previews are fine
-
-            if not full:
-                return
-
-            # Scale to a square THUMB_SIZE crop (cover fit) so only
-            # the small version is ever held in memory.
-            src_w = full.get_width()
-            src_h = full.get_height()
-            scale = max(THUMB_SIZE / src_w, THUMB_SIZE / src_h)
-            scaled_w = max(1, int(src_w * scale))
-            scaled_h = max(1, int(src_h * scale))
-            pixbuf = full.scale_simple(
-                scaled_w, scaled_h,
-                GdkPixbuf.InterpType.BILINEAR
-            )
-            # Let the full-size pixbuf go out of scope immediately
-            del full
-
-            with _preview_cache_lock:
-                _preview_cache[url] = pixbuf
-
-        if not pixbuf:
-            return
-
-        # Only schedule the UI update if the card is still alive
-        def apply(pb=pixbuf, wr=weak_self):
-            card = wr()
-            if card is not None:
-                card._set_texture(pb)
-
-        GLib.idle_add(apply)
-
-    def _set_texture(self, pixbuf):
-        self.picture.set_paintable(_pixbuf_to_texture(pixbuf))
-
-    def do_measure(self, orientation, for_size):
-        """Cap natural size to THUMB_SIZE so FlowBox lays out correctly."""
-        return THUMB_SIZE, THUMB_SIZE, -1, -1
+    def bind(self, model_data, preview_url):
+        """Show *model_data* on this card and start its preview load."""
+        self.model_data = model_data
+        self._name_label.set_label(model_data.get('model_name', ''))
+        base_model = model_data.get('base_model', '').strip()
+        self._base_label.set_label(base_model)
+        self._base_label.set_visible(bool(base_model))
+        self.bind_preview(model_data, preview_url)
+
+    def unbind(self):
+        """Detach the card from its model and drop any queued fetch."""
+        self.model_data = None
+        self.unbind_preview()
+        # The cached menu must not act on the old model
+        self._menu_model_data = None
+        if self._context_popover is not None:
+            self._context_popover.popdown()
 
     def _on_click(self, gesture, n_press, x, y):
-        if self.on_click:
+        if self.on_click and self.model_data is not None:
             self.on_click(self.model_data)
 
     def _on_right_click(self, gesture, n_press, x, y):
         """Show a context menu with card actions."""
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
+        if self.model_data is None:
+            return
+        # Built on first use and kept for the card's lifetime; the
+        # menu acts on whichever model the card showed when opened
+        if self._context_popover is None:
+            self._context_popover = self._build_context_menu()
+        self._menu_model_data = self.model_data
+        rect = Gdk.Rectangle()
+        rect.x, rect.y, rect.width, rect.height = int(x), int(y), 1, 1
+        self._context_popover.set_pointing_to(rect)
+        self._context_popover.popup()
+
+    def _build_context_menu(self):
+        """Create the card's right-click popover."""
         popover = Gtk.Popover(has_arrow=False)
         popover.set_parent(self)
         popover.set_position(Gtk.PositionType.BOTTOM)
-        rect = Gdk.Rectangle()
-        rect.x, rect.y, rect.width, rect.height = int(x), int(y), 1, 1
-        popover.set_pointing_to(rect)
 
         box = Gtk.Box(
             orientation=Gtk.Orientation.VERTICAL,
@@ -201,15 +160,18 @@ class ModelCard(Gtk.Frame):
         delete_btn.set_halign(Gtk.Align.FILL)
         delete_btn.connect(
             'clicked',
-            lambda _: (popover.popdown(), self._confirm_delete())
+            lambda _: (
+                popover.popdown(),
+                self._confirm_delete(self._menu_model_data)
+            )
         )
         box.append(delete_btn)
         popover.set_child(box)
-        popover.popup()
+        return popover
 
-    def _confirm_delete(self):
+    def _confirm_delete(self, model_data):
         """Show a confirmation dialog before deleting."""
-        name = self.model_data.get('model_name', 'this model')
+        name = model_data.get('model_name', 'this model')
         dialog = Adw.AlertDialog(
             heading='Delete Model?',
             body=f'\u201c{name}\u201d will be permanently deleted from disk.'
@@ -221,35 +183,36 @@ class ModelCard(Gtk.Frame):
         )
         dialog.set_default_response('cancel')
         dialog.set_close_response('cancel')
-        dialog.connect('response', self._on_delete_response)
+        dialog.connect('response', self._on_delete_response, model_data)
         dialog.present(self.get_root())
 
-    def _on_delete_response(self, dialog, response):
+    def _on_delete_response(self, dialog, response, model_data):
         """Fire off the delete request if confirmed."""
         if response != 'delete':
             return
-        file_path = self.model_data.get('file_path', '')
-        if not file_path:
+        if not model_data.get('file_path', ''):
             return
         threading.Thread(
             target=self._delete_worker,
-            args=(file_path,),
+            args=(model_data,),
             daemon=True
         ).start()
 
-    def _delete_worker(self, file_path):
+    def _delete_worker(self, model_data):
         """POST delete request to Lora Manager."""
         try:
             url = (
                 f"http://{config.server_address()}"
                 f"/api/lm/checkpoints/delete"
             )
-            resp = requests.post(
-                url, json={'file_path': file_path}, timeout=10
+            resp = lm_browser.SESSION.post(
+                url, json={'file_path': model_data['file_path']},
+                timeout=10
             )
             if resp.status_code == 200:
-                # Remove the card from the FlowBox on the main thread
-                GLib.idle_add(self._remove_self)
+                # Drop the model from the grid on the main thread
+                if self.on_deleted:
+                    GLib.idle_add(self.on_deleted, model_data)
             else:
                 print(
                     f"[models] delete error {resp.status_code}: "
@@ -258,19 +221,11 @@ class ModelCard(Gtk.Frame):
         except Exception as e:
             print(f"[models] delete exception: {e}")
 
-    def _remove_self(self):
-        """Remove this card from its FlowBox parent."""
-        parent = self.get_parent()
-        if parent:
-            flow = parent.get_parent()
-            if flow:
-                flow.remove(parent)
-
 
 class ModelsPage:
     """
     Model browser tab -- fetches pages from ComfyUI-Lora-Manager and
-    displays them in a scrollable FlowBox grid.
+    displays them in a scrollable grid view.
 
     Callbacks
     ---------
@@ -292,6 +247,11 @@ class ModelsPage:
         # Active sidebar filters (sets for multi-select)
         self._active_base_models = set()
         self._active_tags = set()
+        # Repeated base_model / tag_include query params for the active
+        # filters, rebuilt only when the selection changes
+        self._filter_params = ()
+        # Earlier list responses, revalidated by ETag
+        self._list_cache = lm_browser.ListCache()
 
         self._build_ui()
         GLib.idle_add(self._fetch_page, 1)
@@ -332,6 +292,7 @@ class ModelsPage:
 
         self._search = Gtk.SearchEntry(
             placeholder_text='Search Models…',
+            search_delay=SEARCH_DELAY_MS,
             hexpand=True
         )
         self._search.connect('search-changed', self._on_search_changed)
@@ -398,7 +359,14 @@ class ModelsPage:
         self._sidebar_revealer.set_child(self._build_sidebar())
         content_box.append(self._sidebar_revealer)
 
-        # Scrolled window containing the flow grid
+        # Grid column: the scrolled grid with the loading spinner below
+        grid_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            hexpand=True,
+            vexpand=True
+        )
+
+        # Scrolled window containing the grid view
         scroll = Gtk.ScrolledWindow(
             hscrollbar_policy=Gtk.PolicyType.NEVER,
             vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
@@ -410,32 +378,32 @@ class ModelsPage:
         vadj = scroll.get_vadjustment()
         vadj.connect('value-changed', self._on_scroll_changed)
 
-        inner = Gtk.Box(
-            orientation=Gtk.Orientation.VERTICAL,
-            margin_start=16,
-            margin_end=16,
-            margin_bottom=16,
-            hexpand=True
-        )
-
-        self._flow = Gtk.FlowBox(
-            max_children_per_line=12,
-            min_children_per_line=1,
-            row_spacing=12,
-            column_spacing=12,
-            selection_mode=Gtk.SelectionMode.NONE,
-            valign=Gtk.Align.START,
+        # Only the cards in view are realized; the factory rebinds
+        # them as the grid scrolls
+        self._store = Gio.ListStore.new(ModelItem)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_card_setup)
+        factory.connect('bind', self._on_card_bind)
+        factory.connect('unbind', self._on_card_unbind)
+        self._grid = Gtk.GridView(
+            model=Gtk.NoSelection.new(self._store),
+            factory=factory,
+            max_columns=12,
+            min_columns=1,
+            css_classes=['model-grid'],
             hexpand=True
         )
-        inner.append(self._flow)
+        scroll.set_child(self._grid)
+        grid_box.append(scroll)
 
         # Spinner shown while loading
         self._spinner = Gtk.Spinner(
             margin_top=16,
             margin_bottom=16,
-            halign=Gtk.Align.CENTER
+            halign=Gtk.Align.CENTER,
+            visible=False
         )
-        inner.append(self._spinner)
+        grid_box.append(self._spinner)
 
         # Status / empty state
         self._status = Adw.StatusPage(
@@ -449,8 +417,7 @@ class ModelsPage:
         self._status.set_visible(False)
         content_box.append(self._status)
 
-        scroll.set_child(inner)
-        content_box.append(scroll)
+        content_box.append(grid_box)
         self._scroll_adj = vadj
         self._setup_css()
 
@@ -498,6 +465,10 @@ class ModelsPage:
         self._base_model_list.connect(
             'selected-rows-changed', self._on_base_model_changed
         )
+        self._base_model_store = Gio.ListStore.new(lm_browser.FilterItem)
+        self._base_model_list.bind_model(
+            self._base_model_store, self._create_filter_row
+        )
         self._add_toggle_gesture(self._base_model_list)
         sidebar.append(self._base_model_list)
 
@@ -517,18 +488,24 @@ class ModelsPage:
         self._tag_list.connect(
             'selected-rows-changed', self._on_tag_changed
         )
+        self._tag_store = Gio.ListStore.new(lm_browser.FilterItem)
+        self._tag_list.bind_model(
+            self._tag_store, self._create_filter_row
+        )
         self._add_toggle_gesture(self._tag_list)
         sidebar.append(self._tag_list)
 
         sidebar_scroll.set_child(sidebar)
 
-        # Fetch sidebar data in the background
-        threading.Thread(
-            target=self._fetch_sidebar_data, daemon=True
-        ).start()
+        lm_browser.load_filters(
+            'checkpoints', self._base_model_store, self._tag_store, self.log_fn
+        )
 
         return sidebar_scroll
 
+    def _create_filter_row(self, item):
+        return self._make_filter_row(item.value, item.count)
+
     def _make_filter_row(self, label, count):
         """Create a ListBoxRow with a label and count badge."""
         row = Gtk.ListBoxRow()
@@ -579,6 +556,14 @@ class ModelsPage:
                 opacity: 0.75;
                 font-size: 0.75em;
             }
+            .model-grid {
+                background: none;
+                padding: 0 10px 10px;
+            }
+            .model-grid > child {
+                background: none;
+                padding: 6px;
+            }
         """
         css_provider.load_from_data(css)
         Gtk.StyleContext.add_provider_for_display(
@@ -606,85 +591,39 @@ class ModelsPage:
         if self._loading:
             return
         self._loading = True
+        self._spinner.set_visible(True)
         self._spinner.start()
         threading.Thread(
             target=self._fetch_worker,
-            args=(page, self._search_text, self._sort_key()),
+            args=(
+                page, self._search_text, self._sort_key(),
+                self._filter_params
+            ),
             daemon=True
         ).start()
 
-    def _fetch_sidebar_data(self):
-        """Fetch base models and tags to populate the sidebar."""
-        base = config.server_address()
-        try:
-            r = requests.get(
-                f"http://{base}/api/lm/checkpoints/base-models",
-                timeout=10
-            )
-            if r.status_code == 200:
-                items = r.json().get('base_models', [])
-                GLib.idle_add(self._populate_base_models, items)
-        except Exception as e:
-            self.log_fn(f"[models] sidebar base-models error: {e}")
-        try:
-            r = requests.get(
-                f"http://{base}/api/lm/checkpoints/top-tags", timeout=10
-            )
-            if r.status_code == 200:
-                items = r.json().get('tags', [])
-                GLib.idle_add(self._populate_tags, items)
-        except Exception as e:
-            self.log_fn(f"[models] sidebar tags error: {e}")
-
-    def _populate_base_models(self, items):
-        """Add base model rows to the sidebar list."""
-        for item in items:
-            row = self._make_filter_row(
-                item['name'], item['count']
-            )
-            self._base_model_list.append(row)
-
-    def _populate_tags(self, items):
-        """Add tag rows to the sidebar list."""
-        for item in items:
-            row = self._make_filter_row(
-                item['tag'], item['count']
-            )
-            self._tag_list.append(row)
-
-    def _fetch_worker(self, page, search, sort_by):
+    def _fetch_worker(self, page, search, sort_by, filter_params):
         """Worker thread: call the Lora Manager API and schedule update."""
         try:
-            params = {
-                'page': page,
-                'page_size': PAGE_SIZE,
-                'sort_by': sort_by,
-            }
+            params = [
+                ('page', page),
+                ('page_size', PAGE_SIZE),
+                ('sort_by', sort_by),
+            ]
             if search:
-                params['search'] = search
-            # Pass multiple base_model / tag_include params
-            for bm in self._active_base_models:
-                params.setdefault('base_model', [])
-                if isinstance(params['base_model'], list):
-                    params['base_model'].append(bm)
-            for tag in self._active_tags:
-                params.setdefault('tag_include', [])
-                if isinstance(params['tag_include'], list):
-                    params['tag_include'].append(tag)
+                params.append(('search', search))
+            params.extend(filter_params)
             url = (
                 f"http://{config.server_address()}"
                 f"/api/lm/checkpoints/list"
             )
-            resp = requests.get(url, params=params, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
+            status, data = self._list_cache.get(url, params)
+            if data is not None:
                 GLib.idle_add(
                     self._on_page_received, data, page == 1
                 )
             else:
-                self.log_fn(
-                    f"[models] API error {resp.status_code}"
-                )
+                self.log_fn(f"[models] API error {status}")
                 GLib.idle_add(self._on_fetch_done, True)
         except Exception as e:
             self.log_fn(f"[models] fetch error: {e}")
@@ -699,34 +638,35 @@ class ModelsPage:
         if clear_first:
             self._clear_grid()
 
+        # Resolve relative preview URLs once for the whole page so
+        # both forms share a cache entry
+        base = f"http://{config.server_address()}"
+        new_items = []
         for model in items:
-            card = ModelCard(
-                model,
-                on_click=self._on_card_clicked
-            )
-            self._flow.append(card)
+            url = model.get('preview_url', '')
+            if url.startswith('/'):
+                url = base + url
+            new_items.append(ModelItem(model, url))
+        self._store.splice(self._store.get_n_items(), 0, new_items)
 
         # Show empty state only on first page with no results
         empty = (clear_first and len(items) == 0)
         self._status.set_visible(empty)
-        self._flow.set_visible(not empty)
+        self._grid.set_visible(not empty)
         self._on_fetch_done(False)
 
     def _on_fetch_done(self, error=False):
         """Reset loading state and stop spinner."""
         self._loading = False
         self._spinner.stop()
+        self._spinner.set_visible(False)
         if not error:
             # If the content doesn't fill the viewport yet, keep loading
             GLib.idle_add(self._load_until_full)
 
     def _clear_grid(self):
-        """Remove all children from the flow box."""
-        child = self._flow.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self._flow.remove(child)
-            child = nxt
+        """Remove all items from the grid's store."""
+        self._store.remove_all()
 
     def _load_until_full(self):
         """Fetch the next page if content doesn't fill the viewport."""
@@ -822,6 +762,7 @@ class ModelsPage:
         self._tag_list.handler_unblock_by_func(self._on_tag_changed)
         self._active_base_models.clear()
         self._active_tags.clear()
+        self._update_filter_params()
         self._reload()
 
     def _on_base_model_changed(self, listbox):
@@ -830,6 +771,7 @@ class ModelsPage:
             row._filter_value
             for row in listbox.get_selected_rows()
         }
+        self._update_filter_params()
         self._reload()
 
     def _on_tag_changed(self, listbox):
@@ -838,8 +780,16 @@ class ModelsPage:
             row._filter_value
             for row in listbox.get_selected_rows()
         }
+        self._update_filter_params()
         self._reload()
 
+    def _update_filter_params(self):
+        """Rebuild the list query params for the active filters."""
+        self._filter_params = tuple(
+            [('base_model', bm) for bm in sorted(self._active_base_models)]
+            + [('tag_include', tag) for tag in sorted(self._active_tags)]
+        )
+
     # ------------------------------------------------------------------
     # Install from URL
     # ------------------------------------------------------------------
@@ -888,14 +838,13 @@ class ModelsPage:
         Extract model_id and model_version_id from a CivitAI URL.
         Returns (model_id, version_id) as ints or None.
         """
-        import re
         version_id = None
         # modelVersionId in query string takes priority
-        m = re.search(r'modelVersionId=(\d+)', url, re.IGNORECASE)
+        m = _VERSION_ID_RE.search(url)
         if m:
             version_id = int(m.group(1))
         # /models/<id> in path
-        m = re.search(r'/models/(\d+)', url)
+        m = _MODEL_ID_RE.search(url)
         model_id = int(m.group(1)) if m else None
         return model_id, version_id
 
@@ -917,7 +866,7 @@ class ModelsPage:
                 f"http://{config.server_address()}"
                 f"/api/lm/download-model"
             )
-            resp = requests.post(api_url, json=payload, timeout=30)
+            resp = lm_browser.SESSION.post(api_url, json=payload, timeout=30)
             if resp.status_code == 200:
                 self.log_fn(f"[models] download queued: {url}")
                 GLib.idle_add(self._reload)
@@ -930,9 +879,32 @@ class ModelsPage:
             self.log_fn(f"[models] install exception: {e}")
 
     # ------------------------------------------------------------------
-    # Card click
+    # Card factory / click
     # ------------------------------------------------------------------
 
+    def _on_card_setup(self, factory, list_item):
+        """Build a reusable card shell for the grid."""
+        list_item.set_child(ModelCard(
+            on_click=self._on_card_clicked,
+            on_deleted=self._on_model_deleted
+        ))
+
+    def _on_card_bind(self, factory, list_item):
+        item = list_item.get_item()
+        list_item.get_child().bind(item.model_data, item.preview_url)
+
+    def _on_card_unbind(self, factory, list_item):
+        # Clearing the store unbinds every card, which cancels the
+        # previews still queued for the old results
+        list_item.get_child().unbind()
+
+    def _on_model_deleted(self, model_data):
+        """Remove a deleted model's item from the grid."""
+        for pos, item in enumerate(self._store):
+            if item.model_data is model_data:
+                self._store.remove(pos)
+                break
+
     def _on_card_clicked(self, model_data):
         if self.on_model_selected:
             self.on_model_selected(model_data)
@@ -646,9 +646,18 @@ def show_delete_confirm(parent, name, on_confirm):
 
 
 def show_card_context_menu(card, x, y, on_edit, on_delete):
-    """Show a right-click popover with Edit and Delete actions."""
-    popover = Gtk.Popover()
-    popover.set_parent(card)
+    """
+    Show a right-click popover with Edit and Delete actions.
+
+    The popover is built on a card's first right-click and reused after
+    that; its buttons call the callbacks from the latest call.
+    """
+    popover = getattr(card, '_context_popover', None)
+    if popover is None:
+        popover = _build_card_context_menu(card)
+        card._context_popover = popover
+    popover.on_edit = on_edit
+    popover.on_delete = on_delete
 
     rect = Gdk.Rectangle()
     rect.x = int(x)
@@ -656,6 +665,27 @@ def show_card_context_menu(card, x, y, on_edit, on_delete):
     rect.width = 1
     rect.height = 1
     popover.set_pointing_to(rect)
+    popover.popup()
+
+
+def clear_card_context_menu(card):
+    """
+    Close a card's cached context popover and drop its callbacks.
+
+    For cards a list or grid view rebinds to other items, so the menu
+    can't keep acting on the item the card showed when last opened.
+    """
+    popover = getattr(card, '_context_popover', None)
+    if popover is not None:
+        popover.popdown()
+        popover.on_edit = None
+        popover.on_delete = None
+
+
+def _build_card_context_menu(card):
+    """Create the Edit / Delete popover for a card."""
+    popover = Gtk.Popover()
+    popover.set_parent(card)
 
     vbox = Gtk.Box(
         orientation=Gtk.Orientation.VERTICAL,
@@ -669,7 +699,7 @@ def show_card_context_menu(card, x, y, on_edit, on_delete):
     edit_btn = Gtk.Button(label="Edit")
     edit_btn.add_css_class("flat")
     edit_btn.connect(
-        "clicked", lambda _: (popover.popdown(), on_edit())
+        "clicked", lambda _: (popover.popdown(), popover.on_edit())
     )
     vbox.append(edit_btn)
 
@@ -677,9 +707,9 @@ def show_card_context_menu(card, x, y, on_edit, on_delete):
     del_btn.add_css_class("flat")
     del_btn.add_css_class("destructive-action")
     del_btn.connect(
-        "clicked", lambda _: (popover.popdown(), on_delete())
+        "clicked", lambda _: (popover.popdown(), popover.on_delete())
     )
     vbox.append(del_btn)
 
     popover.set_child(vbox)
-    popover.popup()
+    return popover
@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""
+Pieces shared by the Lora-Manager browser pages (LoRAs and models):
+the HTTP session, sidebar filter lists and revalidated list fetches.
+"""
+import json
+import threading
+from collections import OrderedDict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import config
+from gi.repository import GLib, GObject
+
+try:
+    # Optional C parser for the list responses
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Most list responses kept per page for If-None-Match revalidation
+LIST_CACHE_SIZE = 64
+
+# One session for both pages, so API and preview requests reuse
+# keep-alive connections instead of opening one per call
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=1, backoff_factor=0.2)
+))
+
+
+class FilterItem(GObject.Object):
+    """List store entry for a sidebar filter value and its count."""
+
+    def __init__(self, value, count):
+        super().__init__()
+        self.value = value
+        self.count = count
+
+
+class ListCache:
+    """
+    Earlier list responses and their ETags, least recently used first,
+    so an unchanged page comes back as a 304 without a body.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+
+    def get(self, url, params):
+        """
+        GET a list page, revalidating an earlier copy if there is one.
+
+        Returns (status_code, data); data is None unless the server
+        sent a 200 or confirmed the cached copy with a 304.
+        """
+        key = (url, tuple(params))
+        cached = self._entries.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        resp = SESSION.get(url, params=params, headers=headers, timeout=10)
+        if resp.status_code == 304 and cached:
+            self._entries.move_to_end(key)
+            return resp.status_code, cached[1]
+        if resp.status_code != 200:
+            return resp.status_code, None
+        data = _json_loads(resp.content)
+        etag = resp.headers.get('ETag')
+        if etag:
+            self._entries[key] = (etag, data)
+            self._entries.move_to_end(key)
+            if len(self._entries) > LIST_CACHE_SIZE:
+                self._entries.popitem(last=False)
+        return resp.status_code, data
+
+
+def load_filters(api, base_model_store, tag_store, log_fn):
+    """
+    Fill the sidebar stores from /api/lm/<api>/. The base-model and
+    top-tag lists are fetched in parallel in the background.
+    """
+    for path, key, field, store in (
+        ('base-models', 'base_models', 'name', base_model_store),
+        ('top-tags', 'tags', 'tag', tag_store),
+    ):
+        threading.Thread(
+            target=_fetch_filter_list,
+            args=(api, path, key, field, store, log_fn),
+            daemon=True
+        ).start()
+
+
+def _fetch_filter_list(api, path, key, field, store, log_fn):
+    """Worker: fetch one filter list and schedule the store update."""
+    base = config.server_address()
+    try:
+        r = SESSION.get(f"http://{base}/api/lm/{api}/{path}", timeout=10)
+        if r.status_code == 200:
+            GLib.idle_add(_fill_store, store, r.json().get(key, []), field)
+    except Exception as e:
+        log_fn(f"[{api}] sidebar {path} error: {e}")
+
+
+def _fill_store(store, items, field):
+    """Replace a filter store's contents with one splice."""
+    store.splice(
+        0, store.get_n_items(),
+        [FilterItem(item[field], item['count']) for item in items]
+    )
@@ -0,0 +1,306 @@
+#!/usr/bin/python3
+"""
+Preview thumbnails for the LoRA and model grid cards. One download
+pool, in-memory cache and main-thread update queue serve every card
+in the process.
+"""
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+import gi
+import image_cache
+from widgets import lm_browser
+
+gi.require_version('Gtk', '4.0')
+gi.require_version('GdkPixbuf', '2.0')
+
+from gi.repository import Gtk, GLib, Gdk, GdkPixbuf  # noqa
+
+# Card thumbnail dimensions; previews are decoded to cover this size
+THUMB_SIZE = 200
+# Concurrent preview downloads; the rest wait in the pool's queue
+PREVIEW_WORKERS = 8
+# Number of preview textures kept in memory
+PREVIEW_CACHE_SIZE = 512
+# Age in seconds after which a thumbnail on disk is checked against
+# the server before use, so a replaced preview is picked up
+PREVIEW_REVALIDATE_AGE = 24 * 60 * 60
+# Returned by _download_preview when the stored thumbnail is current
+_NOT_MODIFIED = object()
+# Module-level preview cache: absolute URL -> texture at THUMB_SIZE,
+# least recently used first. Persists across reloads; only the small
+# version is kept in memory.
+_preview_cache = OrderedDict()
+_preview_cache_lock = threading.Lock()
+# URL -> (card weakref, data) pairs waiting on a fetch in progress,
+# so cards sharing a preview only download it once
+_preview_waiters = {}
+# Finished preview work for the main thread, drained a few entries per
+# low-priority idle tick so a burst of previews can't hold up scrolling
+# and painting
+PREVIEW_UPDATES_PER_TICK = 4
+_preview_updates = deque()
+_preview_updates_scheduled = False
+_preview_updates_lock = threading.Lock()
+
+_preview_pool = ThreadPoolExecutor(
+    max_workers=PREVIEW_WORKERS, thread_name_prefix='card-preview'
+)
+
+
+def _pixbuf_to_texture(pixbuf):
+    """Convert a GdkPixbuf to a Gdk.MemoryTexture."""
+    has_alpha = pixbuf.get_has_alpha()
+    fmt = (
+        Gdk.MemoryFormat.R8G8B8A8
+        if has_alpha
+        else Gdk.MemoryFormat.R8G8B8
+    )
+    # Loader-decoded pixbufs aren't GBytes-backed, so read_pixel_bytes()
+    # still copies the pixels, but only once in C instead of a Python
+    # bytes copy plus a GBytes copy
+    gbytes = pixbuf.read_pixel_bytes()
+    return Gdk.MemoryTexture.new(
+        pixbuf.get_width(), pixbuf.get_height(),
+        fmt, gbytes, pixbuf.get_rowstride()
+    )
+
+
+# Transparent 1x1 texture shared by every card until its preview loads
+BLANK_TEXTURE = Gdk.MemoryTexture.new(
+    1, 1, Gdk.MemoryFormat.R8G8B8A8, GLib.Bytes.new(bytes(4)), 4
+)
+
+
+def _scale_to_thumb(loader, width, height):
+    """
+    Have the loader decode straight to the THUMB_SIZE cover-fit size,
+    so the full-size image is never held in memory and JPEGs can use
+    scaled decoding. Smaller images are left as they are.
+    """
+    scale = max(THUMB_SIZE / width, THUMB_SIZE / height)
+    if scale < 1:
+        loader.set_size(
+            max(1, int(width * scale)), max(1, int(height * scale))
+        )
+
+
+def _load_disk_preview(url):
+    """
+    Return (pixbuf, mtime) for the thumbnail stored on disk for *url*,
+    or (None, None) if there isn't a readable one.
+    """
+    path = image_cache.preview_path(url)
+    try:
+        mtime = path.stat().st_mtime
+        return GdkPixbuf.Pixbuf.new_from_file(str(path)), mtime
+    except (OSError, GLib.Error):
+        return None, None
+
+
+def _download_preview(url, since=None):
+    """
+    Fetch *url* at thumbnail size and store it on disk. With *since*,
+    the mtime of the stored thumbnail, returns _NOT_MODIFIED if the
+    server reports that the preview hasn't changed since then.
+    """
+    loader = GdkPixbuf.PixbufLoader.new()
+    loader.connect('size-prepared', _scale_to_thumb)
+    closed = False
+    headers = (
+        {'If-Modified-Since': formatdate(since, usegmt=True)}
+        if since else None
+    )
+    try:
+        # Feed the body to the loader as it arrives so decoding
+        # overlaps the download
+        with lm_browser.SESSION.get(
+            url, headers=headers, stream=True, timeout=10
+        ) as resp:
+            if resp.status_code == 304 and since:
+                return _NOT_MODIFIED
+            if resp.status_code != 200:
+                return None
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                loader.write(chunk)
+        # close() finishes the loader even when it raises
+        closed = True
+        loader.close()
+        pixbuf = loader.get_pixbuf()
+    except Exception:
+        return None  # Missing previews are fine
+    finally:
+        # Early returns and failed writes still have to release the
+        # loader's decoder state
+        if not closed:
+            try:
+                loader.close()
+            except GLib.Error:
+                pass
+
+    if pixbuf:
+        try:
+            _ok, data = pixbuf.save_to_bufferv('png', [], [])
+            image_cache.save_preview(url, data)
+        except Exception as e:
+            print(f"[previews] cache write error: {e}")
+    return pixbuf
+
+
+def _cached_preview(url):
+    """Return the cached texture for *url*, or None (main thread)."""
+    # Only the main thread changes the cache, so its own reads and LRU
+    # bumps need no lock; the lock just keeps a worker's cache check
+    # and waiter registration atomic against _finish_preview
+    texture = _preview_cache.get(url)
+    if texture is not None:
+        _preview_cache.move_to_end(url)
+    return texture
+
+
+def _load_preview(weak_card, data, url):
+    """Fetch, scale, and cache preview; update card if still bound."""
+    # Skip the download if the card was dropped or rebound while
+    # this job waited in the queue
+    card = weak_card()
+    if card is None or card._preview_data is not data:
+        return
+    del card
+
+    with _preview_cache_lock:
+        texture = _preview_cache.get(url)
+        waiters = _preview_waiters.get(url)
+        if texture is None:
+            if waiters is not None:
+                # Another job is already fetching this URL and
+                # updates this card too once it's done
+                waiters.append((weak_card, data))
+                return
+            _preview_waiters[url] = [(weak_card, data)]
+    if texture is not None:
+        # A fetch for the same URL finished while this job waited
+        _post_preview_update(_show_preview, weak_card, data, texture)
+        return
+
+    pixbuf = None
+    try:
+        # Thumbnails saved by an earlier run skip the network until
+        # they are old enough to be checked for a replaced preview
+        pixbuf, mtime = _load_disk_preview(url)
+        if pixbuf is None or time.time() - mtime > PREVIEW_REVALIDATE_AGE:
+            fresh = _download_preview(url, since=mtime)
+            if fresh is _NOT_MODIFIED:
+                image_cache.touch_preview(url)
+            elif fresh is not None:
+                pixbuf = fresh
+            # Otherwise keep any stored copy, e.g. while offline
+    finally:
+        # Always release the waiters, even if the fetch failed
+        _post_preview_update(_finish_preview, url, pixbuf)
+
+
+def _finish_preview(url, pixbuf):
+    """
+    Cache the texture for a finished fetch and show it on every card
+    that is still bound to the data it was waiting for.
+    """
+    texture = _pixbuf_to_texture(pixbuf) if pixbuf else None
+    with _preview_cache_lock:
+        waiters = _preview_waiters.pop(url, ())
+        if texture is not None:
+            _preview_cache[url] = texture
+            _preview_cache.move_to_end(url)
+            while len(_preview_cache) > PREVIEW_CACHE_SIZE:
+                _preview_cache.popitem(last=False)
+    if texture is None:
+        return
+    for weak_card, data in waiters:
+        _show_preview(weak_card, data, texture)
+
+
+def _show_preview(weak_card, data, texture):
+    """Set *texture* on the card if it still shows *data*."""
+    card = weak_card()
+    if card is not None and card._preview_data is data:
+        card.picture.set_paintable(texture)
+
+
+def _post_preview_update(func, *args):
+    """Queue func(*args) to run on the main thread; any thread."""
+    global _preview_updates_scheduled
+    _preview_updates.append((func, args))
+    with _preview_updates_lock:
+        if _preview_updates_scheduled:
+            return
+        _preview_updates_scheduled = True
+    GLib.idle_add(_drain_preview_updates, priority=GLib.PRIORITY_LOW)
+
+
+def _drain_preview_updates():
+    """Run a few queued preview updates; repeat while any remain."""
+    global _preview_updates_scheduled
+    for _ in range(PREVIEW_UPDATES_PER_TICK):
+        if not _preview_updates:
+            break
+        func, args = _preview_updates.popleft()
+        func(*args)
+    with _preview_updates_lock:
+        if _preview_updates:
+            return True
+        _preview_updates_scheduled = False
+        return False
+
+
+class PreviewCard(Gtk.Frame):
+    """
+    Base for recycled grid cards with a preview thumbnail. Subclasses
+    place self.picture in their layout and call bind_preview() and
+    unbind_preview() as the grid view rebinds them.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Item the shown or loading preview belongs to
+        self._preview_data = None
+        self._preview_future = None
+        self.picture = Gtk.Picture(
+            paintable=BLANK_TEXTURE,
+            content_fit=Gtk.ContentFit.COVER,
+            can_shrink=True
+        )
+
+    def bind_preview(self, data, url):
+        """Show the preview at *url* for *data*, loading it if needed."""
+        self._preview_data = data
+        # Drop the previous item's thumbnail until the new one loads
+        self.picture.set_paintable(BLANK_TEXTURE)
+        self._cancel_preview()
+
+        if not url:
+            return
+
+        texture = _cached_preview(url)
+        if texture is not None:
+            self.picture.set_paintable(texture)
+            return
+
+        # Load preview image in the background.
+        # Use a weakref so the queued job doesn't keep removed cards
+        # alive.
+        self._preview_future = _preview_pool.submit(
+            _load_preview, weakref.ref(self), data, url
+        )
+
+    def unbind_preview(self):
+        """Forget the bound item and drop any queued fetch."""
+        self._preview_data = None
+        self._cancel_preview()
+
+    def _cancel_preview(self):
+        """Cancel the preview fetch if it hasn't started yet."""
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+            self._preview_future = None